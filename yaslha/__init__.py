@@ -1,27 +1,64 @@
 """Package to handle SLHA-format files and data."""
 
+import importlib
+import os
 import pathlib
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 
-import yaslha.block
-import yaslha.comment
-import yaslha.config
-import yaslha.dumper
-import yaslha.line
-import yaslha.parser
-import yaslha.slha
+if TYPE_CHECKING:
+    import yaslha.config
+    import yaslha.dumper
+    import yaslha.slha
+    from yaslha.block import Block, Decay, InfoBlock  # noqa: F401
+    from yaslha.slha import SLHA  # noqa: F401
 
 __pkgname__ = "yaslha"
 __version__ = "0.3.4"
 __author__ = "Sho Iwamoto / Misho"
 __license__ = "MIT"
 
-cfg = yaslha.config.Config()
+_SUBMODULES = frozenset(
+    ["block", "comment", "config", "dumper", "line", "parser", "slha", "utility"]
+)
+_LAZY_NAMES = {
+    "SLHA": "slha",
+    "Block": "block",
+    "InfoBlock": "block",
+    "Decay": "block",
+}
+
+cfg: "yaslha.config.Config"  # created on the first access by `__getattr__`
+
+# the configuration file in the current directory is located at import, as the
+# configuration itself is read later, after a possible change of the directory.
+try:
+    _LOCAL_CONFIG_FILE = os.path.abspath("yaslha.cfg")
+except OSError:  # the current directory is removed
+    _LOCAL_CONFIG_FILE = "yaslha.cfg"
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules, classes, and the configuration on the first access."""
+    if name in _SUBMODULES:
+        return importlib.import_module("{}.{}".format(__name__, name))
+    elif name in _LAZY_NAMES:
+        module = importlib.import_module("{}.{}".format(__name__, _LAZY_NAMES[name]))
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    elif name == "cfg":
+        config = importlib.import_module("{}.config".format(__name__))
+        value = config.Config()
+        globals()["cfg"] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 
 def parse(text, input_type="AUTO", parser=None, **kwargs):
     # type: (str, str, Any, Any)->yaslha.slha.SLHA
     """Parse a text to return an SLHA object."""
+    import yaslha.parser
+
     if parser is None:
         if input_type.upper() == "AUTO":
             # TODO: implement auto-parser
@@ -35,9 +72,23 @@ def parse(text, input_type="AUTO", parser=None, **kwargs):
     return parser.parse(text)
 
 
+def parse_stream(lines, input_type="AUTO", parser=None, **kwargs):
+    # type: (Iterable[str], str, Any, Any)->yaslha.slha.SLHA
+    """Parse an opened file, or an iterable of lines, to return an SLHA object."""
+    import yaslha.parser
+
+    if parser is None:
+        if input_type.upper() in ["JSON", "YAML"]:
+            raise NotImplementedError
+        parser = yaslha.parser.SLHAParser(**kwargs)
+    return parser.parse_lines(lines)
+
+
 def dump(slha, output_type="SLHA", dumper=None, **kwargs):
     # type: (yaslha.slha.SLHA, str, Optional[yaslha.dumper.AbsDumper], Any)->str
     """Output a dumped string of an SLHA object."""
+    import yaslha.dumper
+
     if dumper is None:
         if output_type.upper() == "JSON":
             dumper = yaslha.dumper.JSONDumper(**kwargs)
@@ -51,13 +102,14 @@ def dump(slha, output_type="SLHA", dumper=None, **kwargs):
 def parse_file(path, **kwargs):
     # type: (Union[str, pathlib.Path], Any)->yaslha.slha.SLHA
     """Parse a file to return an SLHA object."""
-    if isinstance(path, str):
-        path = pathlib.Path(path)
-    return parse(path.read_text(), **kwargs)
+    # read lazily with a large buffer; `newline=""` skips newline translation,
+    # as the parser ignores line terminators.
+    with open(str(path), encoding="utf-8", newline="", buffering=1 << 20) as f:
+        return parse_stream(f, **kwargs)
 
 
 def dump_file(data, path, **kwargs):
     # type: (yaslha.slha.SLHA, Union[str, pathlib.Path], Any)->None
     """Write into a file a dumped string of an SLHA object."""
-    with open(str(path), "w") as f:
+    with open(str(path), "w", encoding="utf-8") as f:
         f.write(dump(data, **kwargs))
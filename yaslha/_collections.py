@@ -1,8 +1,10 @@
 """Definitions of customized collection classes."""
 
+import functools
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
-from typing import Any, Generic, TypeVar, Union, cast
+from operator import eq
+from typing import Any, Generic, Tuple, TypeVar, Union
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -11,10 +13,14 @@ T = TypeVar("T", None, Any)
 _not_specified = object()
 
 
-class _OrderedNormalizedDict(OrderedDict, Generic[K, V], metaclass=ABCMeta):
+class _OrderedNormalizedDict(dict, Generic[K, V], metaclass=ABCMeta):
     """Abstract class for normalized OrderedDict.
 
     Normalization is given by the class method `_n`.
+
+    This class is built on `dict`, which keeps the insertion order, and
+    provides the interfaces of `collections.OrderedDict`; in particular,
+    equality with another ordered dictionary is order-sensitive.
     """
 
     @classmethod
@@ -24,16 +30,13 @@ class _OrderedNormalizedDict(OrderedDict, Generic[K, V], metaclass=ABCMeta):
 
     def __init__(self, *args: Any, **kwds: Any) -> None:
         """Initialize an ordered dictionary."""
-        # first construct a temporal dict
-        tmp = OrderedDict(*args, **kwds)
-        for k, v in tmp.items():
-            self.__setitem__(k, v)
+        self.update(*args, **kwds)
 
     def __setitem__(self, key: K, value: V) -> None:
         super().__setitem__(self._n(key), value)
 
     def __getitem__(self, key: K) -> V:
-        return cast(V, super().__getitem__(self._n(key)))
+        return super().__getitem__(self._n(key))
 
     def __delitem__(self, key: K) -> None:
         super().__delitem__(self._n(key))
@@ -41,19 +44,92 @@ class _OrderedNormalizedDict(OrderedDict, Generic[K, V], metaclass=ABCMeta):
     def __contains__(self, key: Any) -> bool:
         return super().__contains__(self._n(key))
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (OrderedDict, _OrderedNormalizedDict)):
+            return dict.__eq__(self, other) and all(map(eq, self, other))
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        if not self:
+            return "{}()".format(type(self).__name__)
+        return "{}({!r})".format(type(self).__name__, list(self.items()))
+
     # def get(self, k: _KT, default: Union[_VT_co, _T]) -> Union[_VT_co, _T]: ...
 
     def get(self, key: Any, default: Union[V, T] = None) -> Union[V, T]:
-        return self[key] if key in self else default
+        return super().get(self._n(key), default)
 
     def pop(self, key: K, default: Union[V, T, object] = _not_specified) -> Union[V, T]:
-        if default == _not_specified:
-            return cast("V", super().pop(self._n(key)))
+        if default is _not_specified:
+            return super().pop(self._n(key))
         else:
-            return super().pop(self._n(key), default=default)
+            return super().pop(self._n(key), default)
+
+    def popitem(self, last: bool = True) -> Tuple[K, V]:
+        if last:
+            return super().popitem()
+        if not self:
+            raise KeyError("dictionary is empty")
+        key = next(iter(self))
+        return key, super().pop(key)
+
+    def setdefault(self, key: K, default: Any = None) -> V:
+        # not `dict.setdefault`, which would bypass the overridden `__setitem__`
+        n_key = self._n(key)
+        if not super().__contains__(n_key):
+            self[n_key] = default
+        return super().__getitem__(n_key)
+
+    def update(self, *args: Any, **kwds: Any) -> None:
+        if len(args) > 1:
+            raise TypeError("expected at most 1 argument, got {}".format(len(args)))
+        # insert one by one, as `dict.update` would bypass the normalization
+        setitem = self.__setitem__
+        if args:
+            other = args[0]
+            if type(other) is type(self):
+                dict.update(self, other)  # keys are already normalized
+            else:
+                for k, v in other.items() if hasattr(other, "keys") else other:
+                    setitem(k, v)
+        for k, v in kwds.items():
+            setitem(k, v)
+
+    def copy(self) -> "_OrderedNormalizedDict[K, V]":
+        return self.__class__(self)
+
+    # the operators of `dict` would also bypass the normalization
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def __ror__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = self.__class__(other)
+        result.update(self)
+        return result
+
+    def __ior__(self, other: Any) -> Any:
+        self.update(other)
+        return self
 
     def move_to_end(self, key: K, last: bool = True) -> None:
-        return super().move_to_end(self._n(key), last)
+        n_key = self._n(key)
+        value = super().pop(n_key)
+        if last:
+            super().__setitem__(n_key, value)
+        else:
+            items = list(super().items())
+            super().clear()
+            super().__setitem__(n_key, value)
+            dict.update(self, items)
 
 
 class OrderedCaseInsensitiveDict(_OrderedNormalizedDict[K, V]):
@@ -65,7 +141,7 @@ class OrderedCaseInsensitiveDict(_OrderedNormalizedDict[K, V]):
 
     @classmethod
     def _n(self, key: K) -> K:
-        return key.upper() if hasattr(key, "upper") else key  # type: ignore
+        return key.upper() if isinstance(key, str) else key  # type: ignore
 
 
 class OrderedTupleOrderInsensitiveDict(_OrderedNormalizedDict[K, V]):
@@ -77,4 +153,26 @@ class OrderedTupleOrderInsensitiveDict(_OrderedNormalizedDict[K, V]):
 
     @classmethod
     def _n(self, key: K) -> K:
-        return tuple(sorted(key)) if isinstance(key, tuple) else key  # type: ignore
+        if not isinstance(key, tuple):
+            return key
+        n = len(key)
+        if n == 2:  # most of decay channels; sort without allocation
+            return (key[1], key[0]) if key[1] < key[0] else key  # type: ignore
+        elif n == 3:  # sorting network, which returns `key` if already sorted
+            a, b, c = key
+            if a <= b <= c:
+                return key
+            if a > b:
+                a, b = b, a
+            if b > c:
+                b, c = c, b
+                if a > b:
+                    a, b = b, a
+            return (a, b, c)  # type: ignore
+        return _sorted_tuple(key)  # type: ignore
+
+
+@functools.lru_cache(maxsize=4096)
+def _sorted_tuple(key: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Return the sorted tuple, cached as the same keys are repeatedly used."""
+    return tuple(sorted(key))
@@ -1,12 +1,11 @@
-import collections
 from abc import ABCMeta, abstractmethod
-from typing import Any, Optional, TypeVar, Union, overload
+from typing import Any, Dict, Optional, Tuple, TypeVar, Union, overload
 
 K = TypeVar("K")
 V = TypeVar("V")
 T = TypeVar("T", None, Any)
 
-class _OrderedNormalizedDict(collections.OrderedDict[K, V], metaclass=ABCMeta):
+class _OrderedNormalizedDict(Dict[K, V], metaclass=ABCMeta):
     @classmethod
     @abstractmethod
     def _n(self, key: K) -> K: ...
@@ -23,6 +22,10 @@ class _OrderedNormalizedDict(collections.OrderedDict[K, V], metaclass=ABCMeta):
     def pop(self, key: K) -> V: ...
     @overload
     def pop(self, key: K, default: Union[V, T] = ...) -> Union[V, T]: ...
+    def popitem(self, last: bool = True) -> Tuple[K, V]: ...
+    def setdefault(self, key: K, default: Any = None) -> V: ...
+    def update(self, *args: Any, **kwds: Any) -> None: ...
+    def copy(self) -> "_OrderedNormalizedDict[K, V]": ...
     def move_to_end(self, key: K, last: bool = True) -> None: ...
 
 class OrderedCaseInsensitiveDict(_OrderedNormalizedDict[K, V]):
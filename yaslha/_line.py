@@ -3,8 +3,6 @@
 import re
 from typing import Any, List, Sequence, TypeVar, Union, cast
 
-import numpy
-
 T = TypeVar("T", str, List[str])
 
 # -----------------------------------------------------------------------------
@@ -27,7 +25,7 @@ DecayValueType = float
 # regular expressions
 # -----------------------------------------------------------------------------
 """Regexp for float data in SLHA file."""
-FLOAT = r"[+-]?(?:\d+\.\d*|\d+|\.\d+)(?:[deDE][+-]\d+)?"
+FLOAT = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[deDE][+-]\d+)?"
 """Regexp for integer data in SLHA file."""
 INT = r"[+-]?\d+"
 """Regexp for block names in SLHA file."""
@@ -44,6 +42,12 @@ RE_INT = re.compile("^" + INT + "$")
 """Compiled regexp for int data in SLHA file."""
 RE_FLOAT = re.compile("^" + FLOAT + "$")
 
+"""Translation table for Fortran-style exponent letters."""
+_FORTRAN_EXPONENT = str.maketrans("dD", "eE")
+"""Characters with which a plain SLHA number may start or end."""
+_NUMBER_HEAD = frozenset("+-.0123456789")
+_NUMBER_TAIL = frozenset(".0123456789")
+
 
 def cap(regexp: str, name: str) -> str:
     """Return capture-pattern of REGEXP string."""
@@ -60,23 +64,36 @@ def possible(regexp: str) -> str:
 # -----------------------------------------------------------------------------
 def _float(obj: Any) -> float:
     """Convert any values to float if possible, otherwise raise an error."""
-    if isinstance(obj, str):
-        obj = obj.replace("d", "e").replace("D", "E")
+    if isinstance(obj, str) and ("d" in obj or "D" in obj):
+        obj = obj.translate(_FORTRAN_EXPONENT)
     return float(obj)
 
 
 def to_number(v: Any) -> float:
     """Convert any object to float or int depending on the expression."""
-    if isinstance(v, float) or isinstance(v, int):
+    if isinstance(v, (float, int)):
         return v
     elif isinstance(v, str):
-        if RE_INT.match(v):
-            return int(v)
-        elif RE_FLOAT.match(v):
-            return _float(v)
+        # `int` and `float` are faster than regexps, but they also accept
+        # spaces, underscores, "nan", "inf", etc., which are excluded here.
+        head, tail = v[:1], v[-1:]
+        if (
+            (head in _NUMBER_HEAD or head.isdecimal())
+            and (tail in _NUMBER_TAIL or tail.isdecimal())
+            and "_" not in v
+        ):
+            try:
+                return int(v)
+            except ValueError:
+                pass
+            try:
+                return _float(v)
+            except ValueError:
+                pass
         raise ValueError("to_number failed: %s" % v)
-    elif isinstance(v, numpy.ndarray) and v.ndim == 0:
-        return cast(float, v.__pos__())
+    elif getattr(v, "ndim", None) == 0 and hasattr(v, "item"):
+        # zero-dimensional array (e.g., of numpy), without importing numpy
+        return cast(float, v.item())
     else:
         return to_number(str(v))
 
@@ -84,22 +101,27 @@ def to_number(v: Any) -> float:
 def number_to_str(v: float, int_format: str = "d", float_format: str = "16.8e") -> str:
     """Convert int or float to string."""
     if isinstance(v, int):
-        return ("{:" + int_format + "}").format(v)
+        return format(v, int_format)
     elif isinstance(v, float):
         if v == 0:
             v = 0.0  # convert -0.0 to +0.0
-        return ("{:" + float_format + "}").format(v)
+        return format(v, float_format)
     else:
         raise TypeError(v)
 
 
+def _format_comment_str(comment: str, add_sharp: bool, strip: bool) -> str:
+    """Format a comment string; the implementation of `format_comment`."""
+    comment = comment.strip() if strip else comment.rstrip()
+    if add_sharp and not comment.startswith("#"):
+        return "# " + comment if comment else "#"
+    else:
+        return comment
+
+
 def format_comment(comment: T, add_sharp: bool = True, strip: bool = True) -> T:
     """Format a comment string."""
     if isinstance(comment, str):
-        comment = comment.strip() if strip else comment.rstrip()
-        if add_sharp and not comment.startswith("#"):
-            return "# " + comment if comment else "#"
-        else:
-            return comment
+        return _format_comment_str(comment, add_sharp, strip)
     else:
-        return [format_comment(c, add_sharp, strip) for c in comment]
+        return [_format_comment_str(c, add_sharp, strip) for c in comment]
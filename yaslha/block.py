@@ -1,16 +1,17 @@
 """Block-like object of SLHA data."""
 
 
+import copy
 import logging
+import math
 from abc import ABCMeta, abstractmethod
-from collections import OrderedDict
 from typing import (
     Any,
     ClassVar,
+    Dict,
     Generic,
     Iterator,
     List,
-    MutableMapping,
     Optional,
     Sequence,
     Tuple,
@@ -51,6 +52,8 @@ KTG = TypeVar("KTG", KeyType, InfoKeyType, DecayKeyType)
 class GenericBlock(Generic[KTG, CT], metaclass=ABCMeta):
     """Block-like object containing comments."""
 
+    __slots__ = ("head", "_comment")
+
     @abstractmethod
     def __init__(self) -> None:
         self.head = NotImplemented  # type: Union[BlockHeadLine, DecayHeadLine]
@@ -61,6 +64,21 @@ class GenericBlock(Generic[KTG, CT], metaclass=ABCMeta):
         """Give the interface to comments."""
         return self._comment
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "GenericBlock[KTG, CT]":
+        cls = type(self)
+        obj = cls.__new__(cls)  # type: GenericBlock[KTG, CT]
+        memo[id(self)] = obj
+        obj.head = copy.deepcopy(self.head, memo)
+        obj._comment = CommentInterface(obj)
+        self._deepcopy_data(obj, memo)
+        if hasattr(self, "__dict__"):  # attributes of user-defined subclasses
+            obj.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return obj
+
+    @abstractmethod
+    def _deepcopy_data(self, obj: Any, memo: Dict[int, Any]) -> None:
+        """Set to `obj` the deep copies of the data except for head and comments."""
+
     @abstractmethod
     def _get_comment(self, key: KTG) -> CT:
         pass
@@ -106,6 +124,8 @@ class GenericBlock(Generic[KTG, CT], metaclass=ABCMeta):
 class AbsBlock(GenericBlock[KT, CT], Generic[KT, VT, LT, CT], metaclass=ABCMeta):
     """Abstract class for SLHA blocks."""
 
+    __slots__ = ("_data",)
+
     @abstractmethod
     def __init__(self, obj: Union[BlockHeadLine, str]) -> None:
         super().__init__()
@@ -115,7 +135,6 @@ class AbsBlock(GenericBlock[KT, CT], Generic[KT, VT, LT, CT], metaclass=ABCMeta)
             self.head = BlockHeadLine(name=obj)
         else:
             raise TypeError(obj)
-        self._comment = CommentInterface(self)
         # _data must be initialized in subclasses
         self._data = NotImplemented  # type: Any
 
@@ -167,9 +186,15 @@ class AbsBlock(GenericBlock[KT, CT], Generic[KT, VT, LT, CT], metaclass=ABCMeta)
 class Block(AbsBlock[KeyType, ValueType, ValueLine, str]):
     """SLHA block that has one value for one key."""
 
+    __slots__ = ("_sorted_lines",)
+
     def __init__(self, obj: Union[BlockHeadLine, str]) -> None:
         super().__init__(obj)
-        self._data = OrderedDict()  # type: OrderedDict[KeyType, ValueLine]
+        self._data = {}  # type: Dict[KeyType, ValueLine]
+        # cache of `_lines(sort=True)`, cleared when keys or lines are replaced
+        self._sorted_lines = (
+            None
+        )  # type: Optional[Tuple[Tuple[KeyType, ValueLine], ...]]
 
     def __getitem__(self, key: KeyType) -> ValueType:
         """Return the value corresponding to the key."""
@@ -177,24 +202,32 @@ class Block(AbsBlock[KeyType, ValueType, ValueLine, str]):
 
     def __setitem__(self, key: KeyType, value: ValueType) -> None:
         """Set the value for the key."""
-        if key in self._data:
-            self._data[key].value = value
-        else:
+        line = self._data.get(key)
+        if line is None:
             self._data[key] = ValueLine.new(key, value)
+            self._sorted_lines = None
+        else:
+            line.value = value
 
     def __delitem__(self, key: KeyType) -> None:
         """Delete the value for the key."""
         del self._data[key]
+        self._sorted_lines = None
 
     def update_line(self, line: ValueLine) -> None:
         """Add the line to the block, overriding if exists."""
         self._data[line.key] = line
+        self._sorted_lines = None
+
+    def _deepcopy_data(self, obj: "Block", memo: Dict[int, Any]) -> None:
+        obj._data = {k: copy.deepcopy(line, memo) for k, line in self._data.items()}
+        obj._sorted_lines = None
 
     def merge(self, another: "Union[Block, InfoBlock]") -> None:
         """Merge another block."""
         if isinstance(another, Block):
-            for _, line in another._lines():
-                self.update_line(line)
+            self._data.update((line.key, line) for line in another._data.values())
+            self._sorted_lines = None
         else:
             raise ValueError(another)
 
@@ -204,41 +237,37 @@ class Block(AbsBlock[KeyType, ValueType, ValueLine, str]):
         # Meanwhile, the key for `__getitem__` is a tuple only if length > 1.
         if isinstance(key, tuple) and len(key) == 1:
             key = key[0]
-        if key in self._data:
-            return self.__getitem__(key)
-        else:
-            return default
+        line = self._data.get(key)
+        return default if line is None else line.value
 
     def keys(self, sort: bool = False) -> Iterator[KeyType]:
         """Return the keys."""
-        for k, _ in self._lines(sort=sort):
-            yield k
+        if not sort:
+            return iter(self._data)
+        return (k for k, _ in self._lines(sort=True))
 
     __iter__ = keys
 
     def items(self, sort: bool = False) -> Iterator[Tuple[KeyType, ValueType]]:
         """Return (key, value) tuples."""
-        for k, line in self._lines(sort=sort):
-            yield k, line.value
+        return ((k, line.value) for k, line in self._lines(sort=sort))
 
     def _lines(self, sort: bool = False) -> Iterator[Tuple[KeyType, ValueLine]]:
-        if sort:
-            key_line_tuples = list(self._data.items())
-            key_line_tuples.sort(key=lambda k: self._lines_sort_key(k[0]))
-            for i in key_line_tuples:
-                yield i
-        else:
-            for i in self._data.items():
-                yield i
+        # iterators are returned directly, without re-yielding each item
+        if not sort:
+            return iter(self._data.items())
+        if self._sorted_lines is None:
+            self._sorted_lines = tuple(
+                sorted(self._data.items(), key=lambda k: self._lines_sort_key(k[0]))
+            )
+        return iter(self._sorted_lines)
 
     @staticmethod
-    def _lines_sort_key(k: KeyType) -> List[int]:
+    def _lines_sort_key(k: KeyType) -> Tuple[int, ...]:
         if isinstance(k, int):
-            return [k]
-        elif isinstance(k, list):
-            return k
+            return (k,)
         else:
-            return []
+            return ()  # multi-index keys are kept in the insertion order
 
     def _get_comment(self, key: KeyType) -> str:
         return self._data[key].comment
@@ -250,63 +279,74 @@ class Block(AbsBlock[KeyType, ValueType, ValueLine, str]):
         self._data[key].comment = value or ""
 
     def _set_pre_comment(self, key: KeyType, value: Optional[Sequence[str]]) -> None:
-        self._data[key].pre_comment = [v for v in value] if value else []
+        self._data[key].pre_comment = list(value) if value else []
 
 
 class InfoBlock(AbsBlock[InfoKeyType, InfoValueType, InfoLine, List[str]]):
     """SLHA block that may have multiple values for one key."""
 
+    __slots__ = ("_index",)
+
     def __init__(self, obj: Union[BlockHeadLine, str]) -> None:
         super().__init__(obj)
         self._data = []  # type: List[InfoLine]
+        # lines for each key, in the order of the first appearance of the keys
+        self._index = {}  # type: Dict[InfoKeyType, List[InfoLine]]
 
     def __getitem__(self, key: InfoKeyType) -> Sequence[InfoValueType]:
         """Return the value corresponding to the key."""
-        return tuple(line.value for line in self._data if line.key == key)
+        return tuple(line.value for line in self._index.get(key, ()))
 
     def __setitem__(self, key: InfoKeyType, value: Sequence[InfoValueType]) -> None:
         """Set the value for the key."""
         if isinstance(value, str):
             raise TypeError(value)  # Fail-safe; only List[str] is allowed!
         self.__delitem__(key)
-        self._data.extend([InfoLine(key, v) for v in value])
+        lines = [InfoLine(key, v) for v in value]
+        if lines:
+            self._data.extend(lines)
+            self._index[lines[0].key] = lines
 
     def __delitem__(self, key: InfoKeyType) -> None:
         """Delete the value for the key."""
-        self._data = [line for line in self._data if line.key != key]
+        if self._index.pop(key, None) is not None:
+            self._data = [line for line in self._data if line.key != key]
 
     def update_line(self, line: InfoLine) -> None:
         """Add the line to the block, overriding if exists."""
         self.__delitem__(line.key)
-        self._data.append(line)
+        self.append_line(line)
 
     def append_line(self, line: InfoLine) -> None:
         """Add the line, appending to the existing one if exists."""
         self._data.append(line)
+        self._index.setdefault(line.key, []).append(line)
 
     def append(self, key: InfoKeyType, value: InfoValueType) -> None:
         """Append the value for the key."""
         self.append_line(InfoLine(key, value))
 
+    def _deepcopy_data(self, obj: "InfoBlock", memo: Dict[int, Any]) -> None:
+        obj._data = [copy.deepcopy(line, memo) for line in self._data]
+        # lines are shared with `_data`, and thus found in `memo`
+        obj._index = {
+            k: [copy.deepcopy(line, memo) for line in lines]
+            for k, lines in self._index.items()
+        }
+
     def merge(self, another: "Union[Block, InfoBlock]") -> None:
         """Merge another block."""
         if isinstance(another, InfoBlock):
-            updated = {}  # type: MutableMapping[InfoKeyType, bool]
-            for key, line in another._lines():
-                if updated.get(key):
-                    self.append_line(line)
-                else:
-                    updated[key] = True
-                    self.update_line(line)
+            for key, lines in another._index.items():
+                self.__delitem__(key)
+                self._data.extend(lines)
+                self._index[key] = list(lines)
         else:
             raise ValueError(another)
 
     def keys(self, sort: bool = False) -> Iterator[InfoKeyType]:
         """Return the keys."""
-        keys_dict = {}  # type: MutableMapping[InfoKeyType, bool]
-        for line in self._data:
-            keys_dict[line.key] = True
-        keys = list(keys_dict.keys())
+        keys = list(self._index)
         if sort:
             keys.sort()
         for k in keys:
@@ -321,18 +361,17 @@ class InfoBlock(AbsBlock[InfoKeyType, InfoValueType, InfoLine, List[str]]):
 
     def _lines(self, sort: bool = False) -> Iterator[Tuple[InfoKeyType, InfoLine]]:
         for key in self.keys(sort):
-            for line in self._data:
-                if line.key == key:
-                    yield key, line
+            for line in self._index[key]:
+                yield key, line
 
     def _get_comment(self, key: InfoKeyType) -> List[str]:
-        return [line.comment for line in self._data if line.key == key]
+        return [line.comment for line in self._index.get(key, ())]
 
     def _get_pre_comment(self, key: InfoKeyType) -> List[str]:
-        return self._data[key].pre_comment
+        return self._index[key][0].pre_comment
 
     def _set_comment(self, key: InfoKeyType, value: Optional[Sequence[str]]) -> None:
-        lines = [line for line in self._data if line.key == key]
+        lines = self._index.get(key, [])
         if value is None:
             value = []
         if len(lines) < len(value):
@@ -344,15 +383,16 @@ class InfoBlock(AbsBlock[InfoKeyType, InfoValueType, InfoLine, List[str]]):
     def _set_pre_comment(
         self, key: InfoKeyType, value: Optional[Sequence[str]]
     ) -> None:
-        for line in self._data:
-            if line.key == key:
-                line.pre_comment = [v for v in value] if value else []
-                value = []  # to remove all the remaining pre_comment
+        for line in self._index.get(key, ()):
+            line.pre_comment = list(value) if value else []
+            value = []  # to remove all the remaining pre_comment
 
 
 class Decay(GenericBlock[DecayKeyType, str]):
     """Decay block."""
 
+    __slots__ = ("_data", "_sorted_lines", "_br_warned")
+
     br_normalize_threshold = 1.0e-6  # type: ClassVar[float]
 
     def __init__(self, obj: Union[DecayHeadLine, int]) -> None:
@@ -366,6 +406,21 @@ class Decay(GenericBlock[DecayKeyType, str]):
         self._data = (
             OrderedTupleOrderInsensitiveDict()
         )  # type: OrderedTupleOrderInsensitiveDict[DecayKeyType, DecayLine]
+        # cache of `_lines(sort=True)`, cleared when lines or BRs are modified
+        self._sorted_lines = (
+            None
+        )  # type: Optional[Tuple[Tuple[DecayKeyType, DecayLine], ...]]
+
+    def _deepcopy_data(self, obj: "Decay", memo: Dict[int, Any]) -> None:
+        obj._data = OrderedTupleOrderInsensitiveDict()
+        # keys are already normalized; bulk-insert without re-normalizing them
+        dict.update(
+            obj._data,
+            ((k, copy.deepcopy(line, memo)) for k, line in self._data.items()),
+        )
+        obj._sorted_lines = None
+        if hasattr(self, "_br_warned"):
+            obj._br_warned = self._br_warned
 
     @property
     def pid(self) -> int:
@@ -380,13 +435,12 @@ class Decay(GenericBlock[DecayKeyType, str]):
     def update_line(self, line: DecayLine) -> None:
         """Add the line to the block, overriding if exists."""
         self._data[line.key] = line
+        self._sorted_lines = None
 
     def br(self, *key: int) -> DecayValueType:
         """Return the BR of given channel."""
-        if key in self._data:
-            return self._data[key].br
-        else:
-            return 0
+        line = self._data.get(key)
+        return 0 if line is None else line.value
 
     def partial_width(self, *key: int) -> float:
         """Return the width of given channel."""
@@ -394,32 +448,40 @@ class Decay(GenericBlock[DecayKeyType, str]):
 
     def keys(self, sort: bool = False) -> Iterator[DecayKeyType]:
         """Return the keys."""
-        for k, _ in self._lines(sort):
-            yield k
+        if not sort:
+            return iter(self._data)
+        return (k for k, _ in self._lines(sort=True))
 
     __iter__ = keys
 
     def items_br(self, sort=False):
         # type: (bool)->Iterator[Tuple[DecayKeyType, DecayValueType]]
         """Return (key, BR) tuples, sorted by the BR."""
-        for k, line in self._lines(sort):
-            yield k, line.br
+        # BRs are read as `DecayLine.value`, skipping its synonym property `br`
+        return ((k, line.value) for k, line in self._lines(sort))
 
     def items_partial_width(self, sort=False):
         # type: (bool)->Iterator[Tuple[DecayKeyType, float]]
         """Return (key, width) tuples, sorted by the BR."""
+        width = self.width
+        for k, line in self._lines(sort):
+            yield k, width * line.value
+
+    def items_br_and_partial_width(self, sort=False):
+        # type: (bool)->Iterator[Tuple[DecayKeyType, DecayValueType, float]]
+        """Return (key, BR, width) tuples, sorted by the BR."""
+        width = self.width
         for k, line in self._lines(sort):
-            yield k, self.width * line.br
+            yield k, line.value, width * line.value
 
     def _lines(self, sort: bool = False) -> Iterator[Tuple[DecayKeyType, DecayLine]]:
-        if sort:
-            key_line_tuples = list(self._data.items())
-            key_line_tuples.sort(key=lambda k: -k[1].br)
-            for i in key_line_tuples:
-                yield i
-        else:
-            for i in self._data.items():
-                yield i
+        if not sort:
+            return iter(self._data.items())
+        if self._sorted_lines is None:
+            self._sorted_lines = tuple(
+                sorted(self._data.items(), key=lambda k: -k[1].value)
+            )
+        return iter(self._sorted_lines)
 
     def _get_comment(self, key: DecayKeyType) -> str:
         return self._data[key].comment
@@ -433,7 +495,7 @@ class Decay(GenericBlock[DecayKeyType, str]):
     def _set_pre_comment(
         self, key: DecayKeyType, value: Optional[Sequence[str]]
     ) -> None:
-        self._data[key].pre_comment = [v for v in value] if value else []
+        self._data[key].pre_comment = list(value) if value else []
 
     def normalize(self, force: bool = False) -> None:
         """Normalize the branching ratios.
@@ -449,8 +511,8 @@ class Decay(GenericBlock[DecayKeyType, str]):
         ratios are normalized, while if the excess is larger than
         `br_normalize_threshold`, `ValueError` is raised.
         """
-        br_list = [br for _, br in self.items_br(sort=True)]
-        total = sum(reversed(br_list))  # sum taken from smaller to reduce error
+        # `fsum` gives the correctly-rounded sum, without sorting the BRs
+        total = math.fsum([line.value for line in self._data.values()])
 
         if not total > 0:
             return  # stable particle
@@ -475,7 +537,8 @@ class Decay(GenericBlock[DecayKeyType, str]):
             return  # not normalize
 
         for v in self._data.values():
-            v.br /= total
+            v.value /= total
+        self._sorted_lines = None
 
     def set_partial_width(self, *args: Union[int, float]) -> None:
         """Update the partial width and recalculate BRs of all channels."""
@@ -486,11 +549,13 @@ class Decay(GenericBlock[DecayKeyType, str]):
 
         self.normalize()
 
-        if key in self._data:
-            old_partial_width = self.partial_width(*key)
+        target = self._data.get(key)
+        if target is None:
+            old_partial_width = 0.0
+            target = DecayLine(br=0, channel=key)
+            self.update_line(target)
         else:
-            old_partial_width = 0
-            self.update_line(DecayLine(br=0, channel=key))
+            old_partial_width = self.width * target.value
 
         # update total width
         old_width = self.width
@@ -498,14 +563,31 @@ class Decay(GenericBlock[DecayKeyType, str]):
         self.head.width = new_width
 
         # update the modified channel
-        self._data[key].br = new_partial_width / new_width
-        target = self._data[key]
+        target.value = new_partial_width / new_width
 
+        ratio = old_width / new_width
         for line in self._data.values():
-            if line != target:
-                line.br *= old_width / new_width
+            if line is not target:
+                line.value *= ratio
+        self._sorted_lines = None
 
     def remove(self, *key: int) -> None:
         """Remove the channel and recalculate BRs of all the other channels."""
-        self.set_partial_width(*key, 0)
-        del self._data[key]
+        if len(key) < 2 or not all(isinstance(i, int) for i in key):
+            raise KeyError(*key)
+
+        self.normalize()
+
+        line = self._data.pop(key, None)
+        if line is None:
+            return
+        self._sorted_lines = None
+
+        # update total width and rescale BRs of the remaining channels at once
+        old_width = self.width
+        new_width = old_width - old_width * line.value
+        self.head.width = new_width
+        if new_width > 0:
+            ratio = old_width / new_width
+            for v in self._data.values():
+                v.value *= ratio
@@ -1,7 +1,7 @@
 """Module of a class to handle comment interface."""
 
 import logging
-from typing import TYPE_CHECKING, Generic, List, TypeVar, Union
+from typing import TYPE_CHECKING, Generic, List, Optional, TypeVar, Union
 
 from typing_extensions import Literal
 
@@ -21,13 +21,18 @@ logger = logging.getLogger(__name__)
 class CommentInterface(Generic[KTG, CT]):
     """Accessor object to the comments in blocks."""
 
+    __slots__ = ("_block", "_pre")
+
     def __init__(self, block: "GenericBlock[KTG, CT]") -> None:
         self._block = block  # type: GenericBlock[KTG, CT]
-        self._pre = PreCommentInterface(block)  # type: PreCommentInterface[KTG, CT]
+        # created on the first access, as pre-comments are rarely accessed
+        self._pre = None  # type: Optional[PreCommentInterface[KTG, CT]]
 
     @property
     def pre(self) -> "PreCommentInterface[KTG, CT]":
         """Return pre-comment interface."""
+        if self._pre is None:
+            self._pre = PreCommentInterface(self._block)
         return self._pre
 
     def __getitem__(self, key: Union[KTG, HEAD]) -> Union[CT, str]:  # noqa: F811
@@ -52,6 +57,8 @@ class CommentInterface(Generic[KTG, CT]):
 class PreCommentInterface(Generic[KTG, CT]):
     """Accessor object to the pre-line comments in blocks."""
 
+    __slots__ = ("_block",)
+
     def __init__(self, block: "GenericBlock[KTG, CT]"):
         self._block = block  # type: GenericBlock[KTG, CT]
 
@@ -13,7 +13,7 @@ HEAD = Literal["head"]
 
 class CommentInterface(Generic[KTG, CT]):
     _block: "GenericBlock[KTG, CT]"
-    _pre: "PreCommentInterface[KTG, CT]"
+    _pre: Optional["PreCommentInterface[KTG, CT]"]
     def __init__(self, block: "GenericBlock[KTG, CT]") -> None: ...
     @property
     def pre(self) -> "PreCommentInterface[KTG, CT]": ...
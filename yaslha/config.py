@@ -3,18 +3,39 @@
 import collections.abc
 import configparser
 import enum
+import functools
 import os
 import pathlib
-from typing import Any, List, MutableMapping, Type, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+import yaslha
 
 CONFIG_FILES = [
     str(pathlib.Path(__file__).with_name("yaslha.cfg.default")),
     os.path.expanduser("~/.yaslha.cfg"),
-    "yaslha.cfg",
+    yaslha._LOCAL_CONFIG_FILE,
 ]  # latter overrides former
 
 EnumType = TypeVar("EnumType", bound=enum.Enum)
 
+_missing = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_index(enum_class: Type[EnumType]) -> Mapping[str, EnumType]:
+    """Return a map from lower-cased names to the members of an Enum class."""
+    return {i.name.lower(): i for i in enum_class}
+
 
 class SectionWrapper:
     """A wrapper class of `configparser.SectionProxy`."""
@@ -22,39 +43,69 @@ class SectionWrapper:
     def __init__(self, data: configparser.SectionProxy) -> None:
         self._data = data  # type: configparser.SectionProxy
         self.override = {}  # type: MutableMapping[str, Any]
+        # interpolated values, valid while the parser's generation is unchanged
+        self._cache = {}  # type: Dict[str, str]
+        self._generation = None  # type: Optional[int]
 
     def __getattr__(self, name: str) -> Any:
         return self._data.__getattribute__(name)
 
+    def _get(self, key: str) -> str:
+        """Return the value in the section, raising KeyError if not found."""
+        generation = getattr(self._data.parser, "_generation", None)
+        if generation is None:
+            return self._data[key]  # not cacheable
+        if generation != self._generation:
+            self._cache = {}
+            self._generation = generation
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = self._data[key]
+        return value
+
     def __getitem__(self, key: str) -> Any:
-        if key in self.override:
-            return self.override[key]
-        if key in self._data:
-            return self._data[key]
-        raise KeyError(key)
+        value = self.override.get(key, _missing)
+        if value is not _missing:
+            return value
+        return self._get(key)
+
+    def getboolean(self, key: str) -> Optional[bool]:
+        """Get an item as a boolean, or None if not found."""
+        value = self.override.get(key, _missing)
+        if value is not _missing:
+            return value  # type: ignore
+        try:
+            value = self._get(key)
+        except KeyError:
+            return None
+        states = self._data.parser.BOOLEAN_STATES  # type: Mapping[str, bool]
+        result = states.get(value.lower())
+        if result is None:
+            raise ValueError("Not a boolean: {}".format(value))
+        return result
 
     def get_enum(self, key: str, enum_class: Type[EnumType]) -> EnumType:
         """Get an item as an Enum-class object."""
-        if key in self.override:
-            return self.override[key]  # type: ignore
-        if key in self._data:
-            value = self._data[key].lower()
-            for i in enum_class:
-                if i.name.lower() == value:
-                    return i
-        raise KeyError(key)
+        value = self.override.get(key, _missing)
+        if value is not _missing:
+            return value  # type: ignore
+        value = self._get(key).lower()
+        index = _enum_index(enum_class)  # type: Mapping[str, EnumType]
+        member = index.get(value)
+        if member is None:
+            raise KeyError(key)
+        return member
 
     def get_list(self, key: str) -> List[str]:
         """Get a List[str] object."""
-        key_for_a_list = "{}@list".format(key)
-        if key in self.override:
-            value = self.override[key]
-        elif key_for_a_list in self._data:
-            value = self._data[key_for_a_list]
-        else:
-            raise KeyError(key)
+        value = self.override.get(key, _missing)
+        if value is _missing:
+            try:
+                value = self._get("{}@list".format(key))
+            except KeyError:
+                raise KeyError(key)
         if isinstance(value, str):
-            return [v for v in value.split(" ") if v]
+            return value.split()
         elif isinstance(value, collections.abc.Sequence):
             return [str(v) for v in value]
         else:
@@ -65,8 +116,41 @@ class Config(configparser.ConfigParser):
     """Dictionary to store the configurations."""
 
     def __init__(self) -> None:
+        self._wrappers = {}  # type: MutableMapping[str, SectionWrapper]
+        # incremented on every modification, to invalidate the wrapper caches
+        self._generation = 0
         super().__init__(inline_comment_prefixes="#")
         super().read(CONFIG_FILES)
 
+    def read(self, filenames: Any, encoding: Optional[str] = None) -> Any:
+        self._generation += 1
+        return super().read(filenames, encoding=encoding)
+
+    def read_file(self, f: Iterable[str], source: Optional[str] = None) -> None:
+        self._generation += 1
+        super().read_file(f, source=source)
+
+    def read_dict(self, dictionary: Any, source: str = "<dict>") -> None:
+        # also called by `__setitem__`, which replaces a section
+        self._generation += 1
+        super().read_dict(dictionary, source=source)
+
+    def set(self, section: str, option: str, value: Optional[str] = None) -> None:
+        self._generation += 1
+        super().set(section, option, value)
+
+    def remove_option(self, section: str, option: str) -> bool:
+        self._generation += 1
+        return super().remove_option(section, option)
+
+    def remove_section(self, section: str) -> bool:
+        self._generation += 1
+        return super().remove_section(section)
+
     def __getitem__(self, key: Any) -> Any:
-        return SectionWrapper(super().__getitem__(key))
+        # reuse the wrapper as long as the section is not replaced
+        proxy = super().__getitem__(key)
+        wrapper = self._wrappers.get(key)
+        if wrapper is None or wrapper._data is not proxy:
+            wrapper = self._wrappers[key] = SectionWrapper(proxy)
+        return wrapper
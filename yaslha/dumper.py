@@ -1,33 +1,41 @@
 """Dumpers to write SLHA data in various format."""
 
 import enum
+import functools
+import io
 import json
+import operator
 import re
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from typing import (
     Any,
     ClassVar,
+    FrozenSet,
+    Iterable,
     List,
     Mapping,
     MutableMapping,
     Sequence,
+    Tuple,
+    Type,
     TypeVar,
     Union,
 )
 
-import ruamel.yaml
-
 import yaslha
 import yaslha.config
 import yaslha.line
 import yaslha.utility
-from yaslha._line import format_comment
+from yaslha._line import _format_comment_str
 from yaslha.block import Block, Decay, InfoBlock
 
 BlockLike = Union[Block, InfoBlock, Decay]
 T = TypeVar("T")
 
+# a value line of MODSEL block, to be reformatted in `SLHADumper.dump_block`
+_MODSEL_LINE = re.compile(r"^\s*(\d+)\s*(\d+)\s*(#.*)?$")
+
 
 @enum.unique
 class BlocksOrder(enum.Enum):
@@ -68,6 +76,37 @@ class CommentsPreserve(enum.Enum):
         return self != CommentsPreserve.NONE
 
 
+# configurations that take Enum values, with their classes
+_ENUM_CONFIGS = {
+    "blocks_order": BlocksOrder,
+    "values_order": ValuesOrder,
+    "comments_preserve": CommentsPreserve,
+}  # type: Mapping[str, Type[enum.Enum]]
+# configurations of `SLHADumper` that affect `LineOutputOption`
+_LINE_OPTION_CONFIGS = frozenset(
+    ["block_str", "decay_str", "comments_preserve", "float_lower"]
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _sorted_block_names(names: Tuple[str, ...], order: BlocksOrder) -> Tuple[str, ...]:
+    """Return the block names in the output order.
+
+    The result depends only on the names, so it is cached for repeated dumps.
+    """
+    if order == BlocksOrder.ABC:
+        return tuple(sorted(names))
+    return tuple(yaslha.utility.sort_blocks_default(names))
+
+
+@functools.lru_cache(maxsize=64)
+def _sorted_pids(pids: Tuple[int, ...], order: ValuesOrder) -> Tuple[int, ...]:
+    """Return the PIDs, of decays or in MASS block, in the output order."""
+    if order == ValuesOrder.SORTED:
+        return tuple(sorted(pids))
+    return tuple(yaslha.utility.sort_pids_default(pids))
+
+
 class AbsDumper(metaclass=ABCMeta):
     """Abstract class for YASLHA dumpers."""
 
@@ -87,13 +126,8 @@ class AbsDumper(metaclass=ABCMeta):
     @abstractmethod
     def set_config(self, k: str, v: Any) -> None:
         """Set configuration."""
-        if any(
-            [
-                k == "blocks_order" and not isinstance(v, BlocksOrder),
-                k == "values_order" and not isinstance(v, ValuesOrder),
-                k == "comments_preserve" and not isinstance(v, CommentsPreserve),
-            ]
-        ):
+        expected_type = _ENUM_CONFIGS.get(k)
+        if expected_type is not None and not isinstance(v, expected_type):
             raise TypeError(k, v)
         self._config[k] = v
 
@@ -105,53 +139,49 @@ class AbsDumper(metaclass=ABCMeta):
     def dump(self, slha: "yaslha.slha.SLHA") -> str:
         """Return dumped string of an SLHA object."""
 
+    # the following two return lazy iterables, as they are iterated only once.
     def _blocks_sorted(self, slha):
-        # type: (yaslha.slha.SLHA)->List[Union[Block, InfoBlock]]
+        # type: (yaslha.slha.SLHA)->Iterable[Union[Block, InfoBlock]]
         slha.normalize(decays=False)
-        if self.config("blocks_order") == BlocksOrder.KEEP:
-            return list(slha.blocks.values())
-        block_names = list(slha.blocks.keys())
-        if self.config("blocks_order") == BlocksOrder.ABC:
-            block_names.sort()
-        else:
-            block_names = yaslha.utility.sort_blocks_default(block_names)
-        return [slha.blocks[name] for name in block_names]
+        blocks = slha.blocks
+        order = self.config("blocks_order")
+        if order == BlocksOrder.KEEP:
+            return blocks.values()
+        return map(blocks.__getitem__, _sorted_block_names(tuple(blocks), order))
 
     def _decays_sorted(self, slha):
-        # type: (yaslha.slha.SLHA)->List[Decay]
+        # type: (yaslha.slha.SLHA)->Iterable[Decay]
         slha.normalize(blocks=False)
-        if self.config("values_order") == ValuesOrder.KEEP:
-            return list(slha.decays.values())
-        pids = list(slha.decays.keys())
-        if self.config("values_order") == ValuesOrder.SORTED:
-            pids.sort()
-        else:
-            pids = yaslha.utility.sort_pids_default(pids)
-        return [slha.decays[pid] for pid in pids]
+        decays = slha.decays
+        order = self.config("values_order")
+        if order == ValuesOrder.KEEP:
+            return decays.values()
+        return map(decays.__getitem__, _sorted_pids(tuple(decays), order))
 
     def _block_lines_ordered(self, block):
-        # type: (BlockLike)->Sequence[yaslha.line.AbsLine]
-        sort = self.config("values_order") != ValuesOrder.KEEP
+        # type: (BlockLike)->Iterable[yaslha.line.AbsLine]
+        order = self.config("values_order")
         if (
-            isinstance(block, Block)
-            and self.config("values_order") == ValuesOrder.DEFAULT
+            order == ValuesOrder.DEFAULT
+            and isinstance(block, Block)
             and block.name == "MASS"
         ):
-            keys = yaslha.utility.sort_pids_default(list(block.keys()))
-            return [block._data[k] for k in keys]
+            data = block._data
+            return [data[k] for k in _sorted_pids(tuple(data), order)]
         else:
-            return [line for _, line in block._lines(sort=sort)]
+            # lazily, as the lines are iterated only once
+            lines = block._lines(sort=order != ValuesOrder.KEEP)
+            return map(operator.itemgetter(1), lines)
 
     @staticmethod
     def _document_out(lines: Sequence[str]) -> List[str]:
-        return [
-            "#"
-            if not lines
-            else line.replace(" ", "#", 1)
-            if line.startswith(" ")
-            else "#" + line.replace("  ", " ", 1)
-            for line in lines
-        ]
+        result = []  # type: List[str]
+        for line in lines:
+            if line[:1] == " ":
+                result.append("#" + line[1:])  # the leading space to "#"
+            else:
+                result.append("#" + line.replace("  ", " ", 1))  # including ""
+        return result
 
 
 class SLHADumper(AbsDumper):
@@ -162,6 +192,13 @@ class SLHADumper(AbsDumper):
         self.line_option.decay_str = self.config("decay_str")
         self.line_option.comment = self.config("comments_preserve").keep_tail
         self.line_option.pre_comment = self.config("comments_preserve").keep_line
+        self.line_option.float_lower = self.config("float_lower")
+
+    def _update_document_blocks(self) -> None:
+        # normalized to upper case once, not in every dump
+        self._document_blocks = frozenset(
+            v.upper() for v in self.config("document_blocks")
+        )  # type: FrozenSet[str]
 
     def _read_config(self, sw: yaslha.config.SectionWrapper) -> None:
         super()._read_config(sw)
@@ -173,6 +210,7 @@ class SLHADumper(AbsDumper):
         self._config["float_lower"] = sw.getboolean("float_lower")
         self._config["write_version"] = sw.getboolean("write_version")
         self._update_line_option()
+        self._update_document_blocks()
 
     def config(self, k: str) -> Any:
         """Get a current value of configuration."""
@@ -185,14 +223,17 @@ class SLHADumper(AbsDumper):
         # set
         super().set_config(k, v)
         # operations after set
-        if k in ["block_str", "decay_str", "comments_preserve"]:
+        if k in _LINE_OPTION_CONFIGS:
             self._update_line_option()
+        elif k == "document_blocks":
+            self._update_document_blocks()
 
     def __init__(self, **kw: Any) -> None:
         self.line_option = yaslha.line.LineOutputOption()
         self._read_config(yaslha.cfg["SLHADumper"])
         for k, v in kw.items():
             self.set_config(k, v)
+        self._re_version = re.compile(self._version_comment_regexp())
 
     def _version_comment(self) -> str:
         return "# written by {} {}".format(yaslha.__pkgname__, yaslha.__version__)
@@ -200,38 +241,45 @@ class SLHADumper(AbsDumper):
     def _version_comment_regexp(self) -> str:
         return r"^\s*#\s*written\s+by\s+{}\s+".format(yaslha.__pkgname__)
 
+    @staticmethod
+    def _reformat_modsel(match):
+        # type: (re.Match[str])->str
+        if match.group(3):
+            return " {:>5} {:>5}   {}".format(*match.groups())
+        else:
+            return " {:>5} {:>5}   #".format(*match.groups())
+
     def dump(self, slha: "yaslha.slha.SLHA") -> str:
         """Return SLHA-format text of an SLHA object."""
-        document_blocks = [
-            v.upper() for v in self.config("document_blocks")  # normalize to upper
-        ]  # type: Sequence[str]
-
-        lines = []  # type: List[str]
+        document_blocks = self._document_blocks
+        dump_block = self.dump_block
+        blocks = []  # type: List[List[str]]
         for block in self._blocks_sorted(slha):
-            lines.extend(
-                self.dump_block(block, document_block=(block.name in document_blocks))
-            )
-            if self.config("separate_blocks"):
-                lines.append("#")
+            blocks.append(dump_block(block, block.name in document_blocks))
         for decay in self._decays_sorted(slha):
-            lines.extend(
-                self.dump_block(decay, document_block=(decay.pid in document_blocks))
-            )
-            if self.config("separate_blocks"):
-                lines.append("#")
-        if self.config("separate_blocks"):
-            lines.pop()
+            blocks.append(dump_block(decay, decay.pid in document_blocks))
+        tail = []  # type: List[str]
         if self.config("comments_preserve").keep_line:
-            for c in slha.tail_comment:
-                lines.append(format_comment(c, add_sharp=True, strip=False))
+            tail = [
+                _format_comment_str(c, add_sharp=True, strip=False)
+                for c in slha.tail_comment
+            ]
 
         # replace version string
+        texts = []  # type: List[str]
         if self.config("write_version"):
-            re_version = re.compile(self._version_comment_regexp())
-            lines = [v for v in lines if not re_version.match(v)]
-            lines.insert(0, self._version_comment())
+            re_version = self._re_version
+            blocks = [[v for v in b if not re_version.match(v)] for b in blocks]
+            tail = [v for v in tail if not re_version.match(v)]
+            texts.append(self._version_comment())
 
-        result = "\n".join(lines) + "\n"
+        # each block is joined into one string first, which is faster than
+        # joining all the lines at once.
+        if blocks:
+            separator = "\n#\n" if self.config("separate_blocks") else "\n"
+            texts.append(separator.join(["\n".join(b) for b in blocks]))
+        texts.extend(tail)
+        result = "\n".join(texts) + "\n"
 
         if self.config("forbid_last_linebreak"):
             result = result.rstrip()
@@ -241,30 +289,26 @@ class SLHADumper(AbsDumper):
     def dump_block(self, block, document_block=False):
         # type: (BlockLike, bool)->List[str]
         """Return SLHA-format text of a block."""
-        lines = block.head.to_slha(self.line_option)
+        option = self.line_option
+        lines = block.head.to_slha(option)
         for line in self._block_lines_ordered(block):
-            lines.extend(line.to_slha(self.line_option))
+            lines.extend(line.to_slha(option))
 
         # special spacing for MODSEL block
         # because SDECAY somehow use (1x,i5,1x,i5,3x,a100).
         if isinstance(block, Block) and block.name == "MODSEL":
-            re_modsel = re.compile(r"^\s*(\d+)\s*(\d+)\s*(#.*)?$")
-
-            def reformat(match):
-                # type: (re.Match[str])->str
-                if match.group(3):
-                    return " {:>5} {:>5}   {}".format(*match.groups())
-                else:
-                    return " {:>5} {:>5}   #".format(*match.groups())
+            lines = [_MODSEL_LINE.sub(self._reformat_modsel, i) for i in lines]
 
-            lines = [re_modsel.sub(reformat, i) for i in lines]
-
-        # special spacing for MASS block
+        # special spacing for MASS block, i.e., the PDG code right-aligned in 9
+        # columns; the first field is split off without regexp for speed.
         if isinstance(block, Block) and block.name == "MASS":
-            re_mass = re.compile(r"^\s*(\d+)")
-            lines = [
-                re_mass.sub(lambda x: " {:>9}".format(x.group(1)), i) for i in lines
-            ]
+            reformatted = []  # type: List[str]
+            for text in lines:
+                head, sep, rest = text.lstrip().partition(" ")
+                if head.isdecimal():
+                    text = " " + format(head, ">9") + sep + rest
+                reformatted.append(text)
+            lines = reformatted
 
         return self._document_out(lines) if document_block else lines
 
@@ -286,7 +330,7 @@ class AbsMarshalDumper(AbsDumper):
         super().set_config(k, v)
 
     def _format_specification(self) -> Any:
-        return OrderedDict(
+        return dict(
             type="SLHA",
             formatter="{} {}".format(yaslha.__pkgname__, yaslha.__version__),
             scheme=self.SCHEME_VERSION,
@@ -295,15 +339,18 @@ class AbsMarshalDumper(AbsDumper):
     def marshal(self, slha):
         # type: (yaslha.slha.SLHA)->Mapping[str, Any]
         """Return Mashaled object of an SLHA object."""
-        blocks = OrderedDict()  # type: MutableMapping[str, Any]
+        blocks = {}  # type: MutableMapping[str, Any]
         for block in self._blocks_sorted(slha):
             blocks[block.name] = self.marshal_block(block)
-        decays = OrderedDict()  # type: MutableMapping[int, Any]
+        decays = {}  # type: MutableMapping[int, Any]
         for decay in self._decays_sorted(slha):
             decays[decay.pid] = self.marshal_block(decay)
-        tail_comments = [format_comment(c, strip=False) for c in slha.tail_comment]
+        tail_comments = [
+            _format_comment_str(c, add_sharp=True, strip=False)
+            for c in slha.tail_comment
+        ]
 
-        result = OrderedDict()  # type: MutableMapping[str, Any]
+        result = {}  # type: MutableMapping[str, Any]
         result["format"] = self._format_specification()
         if blocks:
             result["block"] = blocks
@@ -323,14 +370,14 @@ class AbsMarshalDumper(AbsDumper):
             value.append(line.dump())
             comment.extend(line._dump_comment())
 
-        comment = [
-            c
-            for c in comment
-            if (c[0] == "pre" and self.config("comments_preserve").keep_line)
-            or (c[0] != "pre" and self.config("comments_preserve").keep_tail)
-        ]
+        preserve = self.config("comments_preserve")  # type: CommentsPreserve
+        keep_line, keep_tail = preserve.keep_line, preserve.keep_tail
+        if not (keep_line and keep_tail):
+            comment = [
+                c for c in comment if (keep_line if c[0] == "pre" else keep_tail)
+            ]
 
-        result = OrderedDict()  # type: MutableMapping[str, Any]
+        result = {}  # type: MutableMapping[str, Any]
         if info:
             result["info"] = info
         if value:
@@ -341,15 +388,27 @@ class AbsMarshalDumper(AbsDumper):
 
 
 class YAMLDumper(AbsMarshalDumper):
-    """A dumper for YAML output."""
+    """A dumper for YAML output.
+
+    The libyaml-based emitter, used if available, quotes strings with
+    consecutive spaces, e.g. ``'ISAJET     V7.67p'``, which the pure-Python
+    emitter writes as plain scalars; both are loaded to the same data.
+    """
 
     def __init__(self, **kw: Any) -> None:
+        import ruamel.yaml  # imported on demand, as it takes long
+
         self._read_config(yaslha.cfg["YAMLDumper"])
         for k, v in kw.items():
             self.set_config(k, v)
 
-        self.yaml = ruamel.yaml.YAML()
+        # the "safe" type uses the libyaml-based emitter if available, which is
+        # much faster than the round-trip one; the keys are kept unsorted, where
+        # the flag is set to the representer, as `YAML` forwards it only in
+        # recent versions of ruamel.yaml.
+        self.yaml = ruamel.yaml.YAML(typ="safe")
         self.yaml.default_flow_style = None
+        self.yaml.representer.sort_base_mapping_type_on_output = False
 
         # we need not it is marked as omap (OrderedDict);
         # it could be just a dict as an output.
@@ -367,7 +426,7 @@ class YAMLDumper(AbsMarshalDumper):
 
     def dump(self, slha: "yaslha.slha.SLHA") -> str:
         """Return YAML-format text of an SLHA object."""
-        stream = ruamel.yaml.compat.StringIO()
+        stream = io.StringIO()
         self.yaml.dump(self.marshal(slha), stream)
         return str(stream.getvalue())
 
@@ -384,4 +443,6 @@ class JSONDumper(AbsMarshalDumper):
 
     def dump(self, slha: "yaslha.slha.SLHA") -> str:
         """Return JSON-format text of an SLHA object."""
-        return json.dumps(self.marshal(slha), indent=self.indent)
+        # marshaled data is a tree, for which the check of circular references
+        # is unnecessary.
+        return json.dumps(self.marshal(slha), indent=self.indent, check_circular=False)
@@ -15,12 +15,16 @@ The line hierarchy is given by:
   - CommentLine
 """
 import collections.abc as abc
+import copy
+import functools
 import logging
 import re
+import sys
 from abc import ABCMeta, abstractmethod
 from typing import (
     Any,
     ClassVar,
+    Dict,
     List,
     Optional,
     Pattern,
@@ -45,8 +49,8 @@ from yaslha._line import (
     KeyType,
     ValueType,
     _float,
+    _format_comment_str,
     cap,
-    format_comment,
     possible,
     to_number,
     number_to_str,
@@ -73,6 +77,7 @@ class LineOutputOption:
     # comment: bool  # whether to output line-end comments
     # pre_comment: bool  # whether to output pre-line comments
     # float_lower: bool  # letter E for float numbers
+    # float_format: str  # format spec for float numbers, set by float_lower
 
     def __init__(self) -> None:
         self.block_str = "Block"
@@ -81,10 +86,28 @@ class LineOutputOption:
         self.pre_comment = True
         self.float_lower = False
 
+    @property
+    def float_lower(self) -> bool:
+        """Return if the letter E for float numbers is in lower case."""
+        return self.float_format == "16.8e"
+
+    @float_lower.setter
+    def float_lower(self, value: bool) -> None:
+        # the format spec is chosen here, not every time a number is formatted
+        self.float_format = "16.8e" if value else "16.8E"
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Sequence[str]:
+    """Return the names of all the slots of the class."""
+    return tuple(n for c in cls.__mro__ for n in getattr(c, "__slots__", ()))
+
 
 class AbsLine(metaclass=ABCMeta):
     """Abstract class for SLHA-line like objects."""
 
+    __slots__ = ("comment", "pre_comment")
+
     output_option = LineOutputOption()  # type: ClassVar[LineOutputOption]
 
     _pattern = NotImplemented  # type: ClassVar[str]
@@ -100,7 +123,8 @@ class AbsLine(metaclass=ABCMeta):
     @classmethod
     def construct(cls: Type[LT], line: str) -> "Optional[LT]":
         """Construct an object from a line if it maches the pattern."""
-        match = cls.pattern().match(line)
+        # the compiled pattern is read directly, as this is called per attempt
+        match = (cls._pattern_compiled or cls.pattern()).match(line)
         if match:
             return cls(**match.groupdict())
         else:
@@ -111,6 +135,17 @@ class AbsLine(metaclass=ABCMeta):
         self.comment = NotImplemented  # type: str
         self.pre_comment = NotImplemented  # type: List[str]
 
+    def __deepcopy__(self: LT, memo: Dict[int, Any]) -> LT:
+        # attributes other than pre-comments are immutable and thus shared
+        cls = type(self)
+        obj = cls.__new__(cls)
+        for name in _slot_names(cls):
+            setattr(obj, name, getattr(self, name))
+        obj.pre_comment = list(self.pre_comment)
+        if hasattr(self, "__dict__"):  # attributes of user-defined subclasses
+            obj.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return obj
+
     # from/to object/string representation
     def __str__(self) -> str:
         return self._to_slha(self.output_option)
@@ -152,16 +187,14 @@ class AbsLine(metaclass=ABCMeta):
     def _format_comment(self, opt: LineOutputOption) -> str:
         """Return the comment formatted for SLHA line."""
         if opt.comment:
-            return format_comment(self.comment, add_sharp=True, strip=True)
+            return _format_comment_str(self.comment, add_sharp=True, strip=True)
         else:
             return "#"
 
     def _format_pre_comment(self, opt: LineOutputOption) -> List[str]:
         """Return the pre-comment formatted as SLHA lines."""
         if opt.pre_comment:
-            return [
-                format_comment(c, add_sharp=True, strip=False) for c in self.pre_comment
-            ]
+            return [_format_comment_str(c, True, False) for c in self.pre_comment]
         else:
             return []
 
@@ -173,15 +206,15 @@ class AbsLine(metaclass=ABCMeta):
     @classmethod
     def _num_to_str(cls, opt, v, allow_int=False):
         # type: (LineOutputOption, float, bool)->str
-        return number_to_str(
-            v if allow_int else float(v),
-            float_format="16.8e" if opt.float_lower else "16.8E",
-        )
+        v = v if allow_int else float(v)
+        return number_to_str(v, float_format=opt.float_format)
 
 
 class BlockHeadLine(AbsLine):
     """Line for block header."""
 
+    __slots__ = ("_name", "q")
+
     _pattern = (
         "Block"
         + SEP
@@ -204,7 +237,8 @@ class BlockHeadLine(AbsLine):
 
     @name.setter
     def name(self, value: str) -> None:
-        self._name = value.upper()
+        # interned, as the same names are used as keys and compared repeatedly
+        self._name = sys.intern(value.upper())
 
     def _to_slha(self, opt: LineOutputOption) -> str:
         if self.q is None:
@@ -240,6 +274,8 @@ class BlockHeadLine(AbsLine):
 class DecayHeadLine(AbsLine):
     """A line with format ``('DECAY',1x,I9,3x,1P,E16.8,0P,3x,'#',1x,A)``."""
 
+    __slots__ = ("pid", "width")
+
     _pattern = "Decay" + SEP + cap(INT, "pid") + SEP + cap(FLOAT, "width") + TAIL
 
     def __init__(self, pid: SInt, width: SFloat, comment: OS = None) -> None:
@@ -286,6 +322,8 @@ class InfoLine(AbsLine):
     kept as List[str].
     """
 
+    __slots__ = ("key", "value")
+
     _pattern = r"\s*" + cap(INT, "key") + SEP + cap(INFO, "value") + TAIL
 
     def __init__(self, key, value, comment=None):
@@ -323,6 +361,8 @@ class InfoLine(AbsLine):
 class ValueLine(AbsLine, metaclass=ABCMeta):
     """Abstract class for value lines in ordinary blocks."""
 
+    __slots__ = ("key", "value")
+
     @abstractmethod
     def __init__(self, key: KeyType, value: SValue, comment: OS = None) -> None:
         self.key = key  # type: KeyType
@@ -354,11 +394,11 @@ class ValueLine(AbsLine, metaclass=ABCMeta):
         if self.key is None:
             k = "      "
         elif isinstance(self.key, int):
-            k = " {:5d}".format(self.key)
+            k = " " + format(self.key, "5d")
         else:
-            k = "{:6}".format("".join(" {:2d}".format(k) for k in self.key))
+            k = format("".join([" " + format(k, "2d") for k in self.key]), "6")
         if isinstance(self.value, int):
-            v = "{:10}      ".format(self.value)
+            v = format(self.value, "10") + "      "
         else:
             v = self._num_to_str(opt, self.value, False)
         return "{}   {}   {}".format(k, v, self._format_comment(opt))
@@ -403,6 +443,8 @@ class ValueLine(AbsLine, metaclass=ABCMeta):
 class NoIndexLine(ValueLine):
     """A line with ``format(9x, 1P, E16.8, 0P, 3x, '#', 1x, A)``."""
 
+    __slots__ = ()
+
     _pattern = r"\s*" + cap(FLOAT, "value") + TAIL
 
     def __init__(self, value, comment=None):
@@ -413,6 +455,8 @@ class NoIndexLine(ValueLine):
 class OneIndexLine(ValueLine):
     """A line with ``format(1x,I5,3x,1P,E16.8,0P,3x,'#',1x,A)``."""
 
+    __slots__ = ()
+
     _pattern = r"\s*" + cap(INT, "i") + SEP + cap(FLOAT, "value") + TAIL
 
     def __init__(self, i, value, comment=None):
@@ -423,6 +467,8 @@ class OneIndexLine(ValueLine):
 class TwoIndexLine(ValueLine):
     """A line with ``format(1x,I2,1x,I2,3x,1P,E16.8,0P,3x,'#',1x,A)``."""
 
+    __slots__ = ()
+
     _pattern = (
         r"\s*"
         + cap(INT, "i1")
@@ -441,6 +487,8 @@ class TwoIndexLine(ValueLine):
 class ThreeIndexLine(ValueLine):
     """A line with ``format(1x,I2,1x,I2,1x,I2,3x,1P,E16.8,0P,3x,'#',1x,A)``."""
 
+    __slots__ = ()
+
     _pattern = (
         r"\s*"
         + cap(INT, "i1")
@@ -461,6 +509,8 @@ class ThreeIndexLine(ValueLine):
 class DecayLine(ValueLine):
     """A decay line ``(3x,1P,E16.8,0P,3x,I2,3x,N (I9,1x),2x,'#',1x,A)``."""
 
+    __slots__ = ()
+
     _pattern = (
         r"\s*"
         + cap(FLOAT, "br")
@@ -493,16 +543,17 @@ class DecayLine(ValueLine):
         self.value = br
 
     def _to_slha(self, opt: LineOutputOption) -> str:
-        pids = "".join("{:9d} ".format(pid) for pid in self.key)
-        return "   {}   {:2d}   {}  {}".format(
-            self._num_to_str(opt, self.br),
-            len(self.key),
-            pids,
+        # the whole line, including all the PDG codes, with one format call
+        n = len(self.key)
+        return ("   {}   {:2d}   " + "{:9d} " * n + "  {}").format(
+            self._num_to_str(opt, self.value),
+            n,
+            *self.key,
             self._format_comment(opt),
         )
 
     def _dump(self) -> List[SFloat]:
-        result = [self.br, len(self.key)]  # type: List[SFloat]
+        result = [self.value, len(self.key)]  # type: List[SFloat]
         result.extend(self.key)
         return result
 
@@ -533,6 +584,8 @@ class CommentLine(AbsLine):
     in blocks or decay-blocks; therefore dumping methods are not implemented.
     """
 
+    __slots__ = ()
+
     _pattern = r"\s*(?P<comment>\#.*)"
 
     def __init__(self, comment: OS = None) -> None:
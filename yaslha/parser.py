@@ -3,8 +3,9 @@
 Parsers for SLHA-format, JSON-format, and YAML-format are provided.
 """
 
+import functools
 import logging
-from typing import Any, List, Optional, Type, Union
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import yaslha.line
 import yaslha.slha
@@ -16,47 +17,69 @@ SLHAParserStatesType = Union[None, Block, InfoBlock, Decay]
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _line_kind(line_class: type) -> Optional[type]:
+    """Return the base line class that determines how the parser handles a line.
+
+    The result is cached for each class, as `isinstance` against ABCs is slow.
+    """
+    if not issubclass(line_class, yaslha.line.AbsLine):
+        raise NotImplementedError(line_class)
+    for kind in (
+        yaslha.line.CommentLine,
+        yaslha.line.ValueLine,
+        yaslha.line.InfoLine,
+        yaslha.line.BlockHeadLine,
+        yaslha.line.DecayHeadLine,
+    ):
+        if issubclass(line_class, kind):
+            return kind
+    return None
+
+
 class SLHAParser:
     """SLHA-format file parser."""
 
+    """Candidate line classes for each parser state, tried in this order."""
+    _line_classes = {
+        type(None): (
+            yaslha.line.BlockHeadLine,
+            yaslha.line.DecayHeadLine,
+            yaslha.line.CommentLine,
+        ),
+        InfoBlock: (
+            yaslha.line.BlockHeadLine,
+            yaslha.line.DecayHeadLine,
+            yaslha.line.InfoLine,
+            yaslha.line.CommentLine,
+        ),
+        Block: (
+            yaslha.line.BlockHeadLine,
+            yaslha.line.DecayHeadLine,
+            yaslha.line.NoIndexLine,
+            yaslha.line.OneIndexLine,
+            yaslha.line.TwoIndexLine,
+            yaslha.line.ThreeIndexLine,
+            yaslha.line.DecayLine,  # for extensions
+            yaslha.line.CommentLine,
+        ),
+        Decay: (
+            yaslha.line.BlockHeadLine,
+            yaslha.line.DecayHeadLine,
+            yaslha.line.DecayLine,
+            yaslha.line.CommentLine,
+        ),
+    }  # type: ClassVar[Dict[type, Tuple[Type[yaslha.line.AbsLine], ...]]]
+
     def __init__(self, **kw: Any) -> None:
         self.processing = None  # type: SLHAParserStatesType
 
     def _parse_line(self, line: str) -> Optional[yaslha.line.AbsLine]:
         if not line.strip():
             return None  # empty line will be ignored
-        if isinstance(self.processing, InfoBlock):
-            classes = [
-                yaslha.line.BlockHeadLine,
-                yaslha.line.DecayHeadLine,
-                yaslha.line.InfoLine,
-                yaslha.line.CommentLine,
-            ]  # type: List[Type[yaslha.line.AbsLine]]
-        elif isinstance(self.processing, Block):
-            classes = [
-                yaslha.line.BlockHeadLine,
-                yaslha.line.DecayHeadLine,
-                yaslha.line.NoIndexLine,
-                yaslha.line.OneIndexLine,
-                yaslha.line.TwoIndexLine,
-                yaslha.line.ThreeIndexLine,
-                yaslha.line.DecayLine,  # for extensions
-                yaslha.line.CommentLine,
-            ]
-        elif isinstance(self.processing, Decay):
-            classes = [
-                yaslha.line.BlockHeadLine,
-                yaslha.line.DecayHeadLine,
-                yaslha.line.DecayLine,
-                yaslha.line.CommentLine,
-            ]
-        elif self.processing is None:
-            classes = [
-                yaslha.line.BlockHeadLine,
-                yaslha.line.DecayHeadLine,
-                yaslha.line.CommentLine,
-            ]
-        else:
+        # look up by the exact type, as isinstance against ABCs is slow
+        classes = self._line_classes.get(type(self.processing))
+        if classes is None:
             logger.critical("Unexpected state: %s", self.processing)
             raise RuntimeError
 
@@ -68,11 +91,22 @@ class SLHAParser:
 
     def parse(self, text: str) -> yaslha.slha.SLHA:
         """Parse SLHA format text and return SLHA object."""
+        return self.parse_lines(text.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> yaslha.slha.SLHA:
+        """Parse lines of SLHA format and return SLHA object.
+
+        `lines` may be any iterable of strings, e.g., an opened file, which is
+        read lazily. Trailing line terminators are ignored.
+        """
         self.processing = None
         slha = yaslha.slha.SLHA()
         comment_lines = []  # type: List[str]
+        # identical comments (e.g., "#" and column headers) share one string
+        known_comments = {}  # type: Dict[str, str]
 
-        for line in text.splitlines():
+        for line in lines:
+            line = line.rstrip("\r\n")
             try:
                 obj = self._parse_line(line)
                 if obj is None:
@@ -81,35 +115,35 @@ class SLHAParser:
                 logger.warning("Unrecognized line: %s", line)
                 continue
 
+            kind = _line_kind(type(obj))
+
             # comment handling
-            if isinstance(obj, yaslha.line.CommentLine):
-                comment_lines.append(obj.comment)
+            if kind is yaslha.line.CommentLine:
+                comment = obj.comment
+                comment_lines.append(known_comments.setdefault(comment, comment))
                 continue
-            elif isinstance(obj, yaslha.line.AbsLine):
-                obj.pre_comment = comment_lines
-                comment_lines = []
-            else:
-                raise NotImplementedError(obj)
+            obj.pre_comment = comment_lines
+            comment_lines = []
 
-            # line handling
-            if isinstance(obj, yaslha.line.BlockHeadLine):
-                self.processing = AbsBlock.new(obj)
+            # line handling, in the order of frequency
+            if kind is yaslha.line.ValueLine:
+                if self.processing is None:
+                    logger.critical("ValueLine found outside of block: %s", line)
+                    raise ValueError(self.processing)
+                self.processing.update_line(obj)  # type: ignore
+            elif kind is yaslha.line.InfoLine:
+                if not isinstance(self.processing, InfoBlock):
+                    logger.critical("InfoLine found outside of INFO block: %s", line)
+                    raise ValueError(self.processing)
+                self.processing.append_line(obj)  # type: ignore
+            elif kind is yaslha.line.BlockHeadLine:
+                self.processing = AbsBlock.new(obj)  # type: ignore
                 assert self.processing is not None
                 slha.add_block(self.processing)
-            elif isinstance(obj, yaslha.line.DecayHeadLine):
-                self.processing = Decay(obj)
+            elif kind is yaslha.line.DecayHeadLine:
+                self.processing = Decay(obj)  # type: ignore
                 assert self.processing is not None
                 slha.add_block(self.processing)
-            elif isinstance(obj, yaslha.line.InfoLine):
-                if not isinstance(self.processing, InfoBlock):
-                    logger.critical("InfoLine found outside of INFO block: %s", line)
-                    raise ValueError(self.processing)
-                self.processing.append_line(obj)
-            elif isinstance(obj, yaslha.line.ValueLine):
-                if self.processing is None:
-                    logger.critical("ValueLine found outside of block: %s", line)
-                    raise ValueError(self.processing)
-                self.processing.update_line(obj)
             else:
                 raise TypeError(obj)
 
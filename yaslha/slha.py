@@ -1,9 +1,7 @@
 """Module of SLHA object class."""
 import copy
 import logging
-from collections import OrderedDict
-from typing import Any, List, Tuple, Union
-from typing import OrderedDict as TypingOrderedDict
+from typing import Any, Dict, List, Tuple, Union
 
 from yaslha._collections import OrderedCaseInsensitiveDict
 from yaslha.block import AbsBlock, Block, Decay, InfoBlock
@@ -16,17 +14,21 @@ logger = logging.getLogger(__name__)
 
 class BlocksDict(OrderedCaseInsensitiveDict[str, Union[Block, InfoBlock]]):
     def __setitem__(self, key: str, value: Union[Block, InfoBlock]) -> None:
-        if value.head.name.upper() != key.upper():
+        key = self._n(key)
+        if value.head.name != key:  # `head.name` is always in upper case
             logger.error(
                 "Inconsistent SLHA key: Block %s set to the key %s",
-                value.head.name.upper(),
-                key.upper(),
+                value.head.name,
+                key,
             )
             exit(1)
         super().__setitem__(key, value)
 
 
-class DecaysDict(TypingOrderedDict[int, Decay]):
+class DecaysDict(Dict[int, Decay]):
+    def __init__(self, *args: Any, **kwds: Any) -> None:
+        self.update(*args, **kwds)
+
     def __setitem__(self, key: int, value: Decay) -> None:
         if value.head.pid != key:
             logger.error(
@@ -35,13 +37,44 @@ class DecaysDict(TypingOrderedDict[int, Decay]):
             exit(1)
         super().__setitem__(key, value)
 
-    def __getitem__(self, key: int) -> Decay:
-        return super().__getitem__(key)
+    # the following methods of `dict` would bypass the consistency check
+    def update(self, *args: Any, **kwds: Any) -> None:
+        setitem = self.__setitem__
+        for k, v in dict(*args, **kwds).items():
+            setitem(k, v)
+
+    def setdefault(self, key: int, default: Decay) -> Decay:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def copy(self) -> "DecaysDict":
+        return DecaysDict(self)
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def __ror__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = DecaysDict(other)
+        result.update(self)
+        return result
+
+    def __ior__(self, other: Any) -> Any:
+        self.update(other)
+        return self
 
 
 class SLHA:
     """SLHA object, representing a SLHA-format text."""
 
+    __slots__ = ("blocks", "decays", "tail_comment")
+
     def __init__(self) -> None:
         self.blocks = BlocksDict()  # type: BlocksDict
         self.decays = DecaysDict()  # type: DecaysDict
@@ -109,9 +142,10 @@ class SLHA:
             value.head.pid = key  # correct the pid of Decay
             self.decays[key] = value
         elif hasattr(key, "__len__") and len(key) >= 2 and isinstance(key[0], str):
-            if key[0] not in self.blocks:
-                self.add_block(AbsBlock.new(BlockHeadLine(name=key[0])))
-            block = self.blocks[key[0]]
+            block = self.blocks.get(key[0])
+            if block is None:
+                block = AbsBlock.new(BlockHeadLine(name=key[0]))
+                self.add_block(block)
             block[key[1] if len(key) == 2 else tuple(key[1:])] = value
         else:
             raise KeyError(key)
@@ -130,21 +164,29 @@ class SLHA:
 
     def normalize(self, blocks: bool = True, decays: bool = True) -> None:
         """Normalize the head-lines so that names/pids match the dict keys."""
+        # heads are usually consistent, so rewritten only if needed; in
+        # particular, the name setter would upper-case and intern it again.
         if blocks:
             for name, b in self.blocks.items():
-                b.head.name = name
+                if b.head.name != name:
+                    b.head.name = name
         if decays:
             for pid, d in self.decays.items():
-                d.head.pid = pid
+                if d.head.pid != pid:
+                    d.head.pid = pid
 
     def merge(self, another: "SLHA") -> None:
         """Merge another SLHA data into this object."""
+        blocks = self.blocks
         for name, block in another.blocks.items():
-            self_block = self.blocks.get(name)
-            if self_block:
-                self_block.merge(block)
+            self_block = blocks.get(name)
+            if self_block is None:
+                blocks[name] = copy.deepcopy(block)
             else:
-                self.blocks[name] = copy.deepcopy(block)
-        self.decays.update(copy.deepcopy(another.decays))
+                self_block.merge(block)
+        # copy each Decay directly, not through an intermediate DecaysDict
+        self.decays.update(
+            (pid, copy.deepcopy(decay)) for pid, decay in another.decays.items()
+        )
         if another.tail_comment:
             self.tail_comment = copy.deepcopy(another.tail_comment)
@@ -0,0 +1,164 @@
+"""Unit test of `block` module."""
+
+import copy
+import logging
+import math
+import unittest
+
+import pytest
+
+from yaslha.block import Block, Decay, InfoBlock
+from yaslha.line import DecayLine, InfoLine
+
+logger = logging.getLogger("test_info")
+
+
+class TestBlock(unittest.TestCase):
+    """Unit test of `Block`."""
+
+    def test_sorted_lines(self):
+        b = Block("MASS")
+        b[25] = 125.0
+        b[6] = 173.0
+        assert list(b.keys(sort=True)) == [6, 25]
+        b[1] = 0.0
+        assert list(b.keys(sort=True)) == [1, 6, 25]
+        b[6] = 172.5
+        assert list(b.items(sort=True)) == [(1, 0.0), (6, 172.5), (25, 125.0)]
+        del b[1]
+        assert list(b.keys(sort=True)) == [6, 25]
+
+        b = Block("NMIX")
+        b[2, 1] = 0.5
+        b[1, 2] = -0.5
+        b[1, 1] = 1.0
+        assert list(b.keys(sort=True)) == [(2, 1), (1, 2), (1, 1)]
+        assert list(b.keys()) == [(2, 1), (1, 2), (1, 1)]
+
+    def test_merge(self):
+        b1 = Block("MASS")
+        b1[6] = 173.0
+        b1[25] = 125.0
+        b2 = Block("MASS")
+        b2[1] = 0.0
+        b2[6] = 172.5
+        b1.merge(b2)
+        assert list(b1.items()) == [(6, 172.5), (25, 125.0), (1, 0.0)]
+        assert list(b1.keys(sort=True)) == [1, 6, 25]
+
+
+class TestDecay(unittest.TestCase):
+    """Unit test of `Decay`."""
+
+    def setUp(self):
+        self.d = Decay(6)
+        self.d.head.width = 2.0
+        self.d.update_line(DecayLine(0.25, (5, 24)))
+        self.d.update_line(DecayLine(0.75, (3, 24)))
+
+    def test_sorted_lines(self):
+        assert list(self.d.keys(sort=True)) == [(3, 24), (5, 24)]
+        self.d.set_partial_width(5, 24, 6.0)
+        assert self.d.width == 7.5
+        assert list(self.d.keys(sort=True)) == [(5, 24), (3, 24)]
+        self.d.remove(5, 24)
+        assert list(self.d.keys(sort=True)) == [(3, 24)]
+        self.d.update_line(DecayLine(0.5, (1, 24)))
+        assert list(self.d.keys(sort=True)) == [(3, 24), (1, 24)]
+
+    def test_items(self):
+        assert list(self.d.items_br(sort=True)) == [((3, 24), 0.75), ((5, 24), 0.25)]
+        assert list(self.d.items_partial_width()) == [((5, 24), 0.5), ((3, 24), 1.5)]
+        assert list(self.d.items_br_and_partial_width(sort=True)) == [
+            ((3, 24), 0.75, 1.5),
+            ((5, 24), 0.25, 0.5),
+        ]
+
+    def test_remove(self):
+        self.d.remove(3, 24)
+        assert self.d.width == 0.5
+        assert list(self.d.items_br()) == [((5, 24), 1.0)]
+        self.d.remove(1, 2)  # no error for non-existing channel
+        assert self.d.width == 0.5
+        self.d.remove(24, 5)
+        assert self.d.width == 0
+        assert list(self.d.keys()) == []
+        with pytest.raises(KeyError):
+            self.d.remove(5)
+
+    def test_normalize(self):
+        self.d.update_line(DecayLine(0.5, (1, 24)))
+        with pytest.raises(ValueError):
+            self.d.normalize()
+        self.d.normalize(force=True)
+        assert self.d.br(3, 24) == 0.5
+        assert self.d.br(5, 24) == 0.25 / 1.5
+        assert math.fsum(br for _, br in self.d.items_br()) == 1
+
+
+class TestInfoBlock(unittest.TestCase):
+    """Unit test of `InfoBlock`."""
+
+    def setUp(self):
+        self.b = InfoBlock("SPINFO")
+        self.b.append_line(InfoLine(1, "SOFTSUSY", "name"))
+        self.b.append_line(InfoLine(3, "warning 1", "first"))
+        self.b.append_line(InfoLine(2, "1.8.4", "version"))
+        self.b.append_line(InfoLine(3, "warning 2", "second"))
+
+    def test_access(self):
+        assert self.b[1] == ("SOFTSUSY",)
+        assert self.b[3] == ("warning 1", "warning 2")
+        assert self.b[4] == ()
+        assert list(self.b.keys()) == [1, 3, 2]
+        assert list(self.b.keys(sort=True)) == [1, 2, 3]
+        assert list(self.b.items()) == [
+            (1, "SOFTSUSY"),
+            (3, "warning 1"),
+            (3, "warning 2"),
+            (2, "1.8.4"),
+        ]
+
+    def test_modify(self):
+        self.b[3] = ["new warning"]
+        assert self.b[3] == ("new warning",)
+        self.b.append(1, "another name")
+        assert self.b[1] == ("SOFTSUSY", "another name")
+        self.b.update_line(InfoLine(2, "1.8.5"))
+        assert self.b[2] == ("1.8.5",)
+        del self.b[1]
+        del self.b[4]  # no error for non-existing key
+        assert self.b[1] == ()
+        assert list(self.b.keys()) == [3, 2]
+
+    def test_merge(self):
+        another = InfoBlock("SPINFO")
+        another.append(3, "new warning 1")
+        another.append(4, "error")
+        another.append(3, "new warning 2")
+        self.b.merge(another)
+        assert self.b[3] == ("new warning 1", "new warning 2")
+        assert self.b[4] == ("error",)
+        assert list(self.b.keys()) == [1, 2, 3, 4]
+        another.append(3, "new warning 3")
+        assert len(self.b[3]) == 2
+
+    def test_deepcopy(self):
+        self.b.comment.pre[1] = ["# pre-comment"]
+        c = copy.deepcopy(self.b)
+        assert list(c.items()) == list(self.b.items())
+        assert c._index[3][1] is c._data[3]  # lines are shared in the copy
+        c.comment[1] = ["changed"]
+        c.comment.pre[1][0] = "# changed"
+        c.append(3, "warning 3")
+        assert self.b.comment[1] == ["name"]
+        assert self.b.comment.pre[1] == ["# pre-comment"]
+        assert self.b[3] == ("warning 1", "warning 2")
+
+    def test_comment(self):
+        assert self.b.comment[3] == ["first", "second"]
+        self.b.comment[3] = ["changed"]
+        assert self.b.comment[3] == ["changed", "second"]
+        self.b.comment.pre[3] = ["# pre-comment"]
+        assert self.b.comment.pre[3] == ["# pre-comment"]
+        assert self.b.comment.pre[1] == []
@@ -1,6 +1,7 @@
 """Unit test of `_collections` module."""
 
 import collections
+import itertools
 import logging
 import unittest
 from typing import Any, MutableMapping
@@ -162,6 +163,23 @@ class TestOrderedCaseInsensitiveDict(unittest.TestCase):
         assert self.d[2] is True
         assert self.d[1] == "AnB"
 
+    def test_or(self):
+        d = self.d | {"nmix": 2}
+        assert isinstance(d, oci_dict)
+        assert list(d.keys()) == ["FIRST", 2, ("Third", 0), 1, "NMIX"]
+        d = {"first": 0, "nmix": 2} | self.d
+        assert isinstance(d, oci_dict)
+        assert list(d.keys()) == ["FIRST", "NMIX", 2, ("Third", 0), 1]
+        assert d["first"] == 100
+        self.d |= {"nmix": 2}
+        assert "nmix" in self.d
+        assert list(self.d.keys())[-1] == "NMIX"
+
+    def test_setdefault(self):
+        assert self.d.setdefault("first", 0) == 100
+        assert self.d.setdefault("nmix", 2) == 2
+        assert list(self.d.keys())[-1] == "NMIX"
+
     def test_pop(self):
         assert self.d.pop("fiRSt") == 100
         assert self.d.pop(2) is None
@@ -245,6 +263,14 @@ class TestOrderedTupleOrderInsensitiveDict(unittest.TestCase):
         assert (300,) not in self.d
         assert (1, 2, 3, 4) in self.d
 
+    def test_short_keys(self):
+        # two- and three-element keys are normalized without `sorted`
+        for n in [2, 3]:
+            for key in itertools.product([1, 2, 3], repeat=n):
+                d = toi_dict([(key, sum(key))])  # type: toi_dict[Any, Any]
+                assert list(d.keys()) == [tuple(sorted(key))]
+                assert d[key[::-1]] == sum(key)
+
     def test_delitem(self):
         del self.d[0, 1, 1, 1]
         del self.d[300]
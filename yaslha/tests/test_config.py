@@ -0,0 +1,80 @@
+"""Unit test of `config` module."""
+
+import logging
+import os
+import pathlib
+import tempfile
+import unittest
+
+import pytest
+
+import yaslha
+from yaslha.config import CONFIG_FILES, Config
+from yaslha.dumper import BlocksOrder
+
+logger = logging.getLogger("test_info")
+
+
+class TestSectionWrapper(unittest.TestCase):
+    """Unit test of `SectionWrapper`."""
+
+    def setUp(self):
+        self.cfg = Config()
+        self.sw = self.cfg["SLHADumper"]
+
+    def test_get(self):
+        assert self.sw["block_str"] == "BLOCK"
+        assert self.sw.getboolean("separate_blocks") is False
+        assert self.sw.getboolean("no_such_key") is None
+        assert self.sw.get_enum("blocks_order", BlocksOrder) == BlocksOrder.DEFAULT
+        assert self.sw.get_list("document_blocks") == []
+        for method in [self.sw.__getitem__, self.sw.get_list]:
+            with pytest.raises(KeyError):
+                method("no_such_key")
+
+    def test_modification(self):
+        assert self.sw["block_str"] == "BLOCK"
+        self.cfg.set("SLHADumper", "block_str", "Block")
+        assert self.sw["block_str"] == "Block"
+        self.cfg.read_string("[SLHADumper]\nseparate_blocks: yes\n")
+        assert self.sw.getboolean("separate_blocks") is True
+        self.cfg.remove_option("SLHADumper", "block_str")
+        with pytest.raises(KeyError):
+            self.sw["block_str"]
+        self.cfg.set("SLHADumper", "block_str", "Block")
+        assert self.sw["block_str"] == "Block"
+        self.cfg["SLHADumper"] = {}  # replace the section
+        with pytest.raises(KeyError):
+            self.sw["block_str"]
+        self.cfg.read_dict({"SLHADumper": {"block_str": "BLOCK"}})
+        assert self.sw["block_str"] == "BLOCK"
+        self.cfg.set("SLHADumper", "separate_blocks", "maybe")
+        with pytest.raises(ValueError):
+            self.sw.getboolean("separate_blocks")
+
+    def test_override(self):
+        self.sw.override["block_str"] = "Block"
+        self.sw.override["separate_blocks"] = True
+        self.sw.override["blocks_order"] = BlocksOrder.ABC
+        self.sw.override["document_blocks"] = "MASS  NMIX"
+        assert self.sw["block_str"] == "Block"
+        assert self.sw.getboolean("separate_blocks") is True
+        assert self.sw.get_enum("blocks_order", BlocksOrder) == BlocksOrder.ABC
+        assert self.sw.get_list("document_blocks") == ["MASS", "NMIX"]
+
+
+class TestConfig(unittest.TestCase):
+    """Unit test of `Config`."""
+
+    def test_local_config_file(self):
+        # the file in the directory at import is used even after `chdir`
+        assert CONFIG_FILES[-1] == yaslha._LOCAL_CONFIG_FILE
+        assert pathlib.Path(CONFIG_FILES[-1]).parent == pathlib.Path.cwd()
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            pathlib.Path(tmp, "yaslha.cfg").write_text("[SLHADumper]\nblock_str: B\n")
+            os.chdir(tmp)
+            try:
+                assert Config()["SLHADumper"]["block_str"] == "BLOCK"
+            finally:
+                os.chdir(cwd)
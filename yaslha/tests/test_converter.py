@@ -7,8 +7,10 @@ import traceback
 import unittest
 
 import coloredlogs
+import ruamel.yaml
 from click.testing import CliRunner
 
+import yaslha
 import yaslha.dumper
 from yaslha.script import convert
 
@@ -82,3 +84,28 @@ class TestConverter(unittest.TestCase):
                             result2
                         )
                         compare_lines(result1_output, result2_output)
+
+    def test_parse_file(self):
+        for input_file in self.inputs:
+            with open(input_file) as f:
+                text = f.read()
+            expected = yaslha.dump(yaslha.parse(text))
+            assert yaslha.dump(yaslha.parse_file(input_file)) == expected
+            crlf_lines = [line + "\r\n" for line in text.splitlines()]
+            assert yaslha.dump(yaslha.parse_stream(crlf_lines)) == expected
+
+    def test_yaml_output(self):
+        dumper = yaslha.dumper.YAMLDumper()
+        for input_file in self.inputs:
+            slha = yaslha.parse_file(input_file)
+            marshaled = dumper.marshal(slha)
+            loaded = ruamel.yaml.YAML(typ="safe").load(dumper.dump(slha))
+            assert loaded == marshaled
+            assert list(loaded["block"]) == list(marshaled["block"])  # not sorted
+
+        # strings with consecutive spaces are quoted only by libyaml emitter
+        value = "ISAJET     V7.67p  30-MAY-2003 19:26"
+        if ruamel.yaml.__with_libyaml__:
+            value = "'{}'".format(value)
+        output = dumper.dump(yaslha.parse_file(self.data_dir / "isasusy.spc"))
+        assert "\n    - [2, {}]\n".format(value) in output
@@ -95,5 +95,24 @@ DECAY   999     1.00E-02    # data for testing
         assert self.slha["spinfo", 2] == ("1.8.4",)
         assert self.slha[999].partial_width(123, 123, 123) == 0.40 * 0.01
 
+    def test_merge(self):
+        c = SLHAParser().parse(
+            "Block MODSEL\n  1  2\nBlock MASS\n  25  1.25e+02\n"
+            "DECAY 999 2.00E-02\n  1.0  2  1  -1\n"
+        )
+        c.merge(self.slha)
+        assert list(c.blocks) == ["MODSEL", "MASS", "SPINFO", "ALPHA", "GAUGE", "AU"]
+        assert list(c.decays) == [999, 1000023]
+        assert c["modsel", 1] == 1
+        assert c["mass", 25] == 125
+        assert c[999].width == 1.0e-2
+        assert c[999].br(-2, 1) == 0
+        assert c[999].br(123, 123, 123) == 0.40
+
+        c["au", 3, 3] = 1
+        c[999].set_partial_width(123, 123, 123, 0.0)
+        assert self.slha["au", 3, 3] == -5.04995511e02
+        assert self.slha[999].br(123, 123, 123) == 0.40
+
 
 # cspell:ignore softsusy modsel sminputs msbar drbar mgut mssm higgs hmix sugra tanb
@@ -0,0 +1,99 @@
+"""Unit test of `_line` module."""
+
+import logging
+import unittest
+
+import numpy
+import pytest
+
+from yaslha._line import _float, format_comment, number_to_str, to_number
+from yaslha.block import Block
+from yaslha.dumper import SLHADumper
+from yaslha.line import LineOutputOption, OneIndexLine
+
+logger = logging.getLogger("test_info")
+
+
+class TestToNumber(unittest.TestCase):
+    """Unit test of number conversion helpers."""
+
+    def test_int(self):
+        for s, v in [
+            ("0", 0),
+            ("42", 42),
+            ("+3", 3),
+            ("-1000021", -1000021),
+            ("\u0664\u0662", 42),  # non-ASCII digits are accepted as by `\d`
+        ]:
+            result = to_number(s)
+            assert isinstance(result, int)
+            assert result == v
+
+    def test_float(self):
+        for s, v in [
+            ("1.5", 1.5),
+            ("-.5", -0.5),
+            ("5.", 5.0),
+            ("1.23e+04", 1.23e4),
+            ("1.23E-04", 1.23e-4),
+            ("1.23d+04", 1.23e4),
+            ("-1.23D-04", -1.23e-4),
+        ]:
+            result = to_number(s)
+            assert isinstance(result, float)
+            assert result == v
+
+    def test_non_string(self):
+        assert to_number(3) == 3
+        assert to_number(2.5) == 2.5
+        assert to_number(numpy.array(7)) == 7
+        assert to_number(numpy.array(0.25)) == 0.25
+
+    def test_invalid(self):
+        for s in ["", "abc", "1.2.3", "1e", "1.0E+", "nan", "+inf", "1_000", " 1"]:
+            with pytest.raises(ValueError):
+                to_number(s)
+
+    def test_float_helper(self):
+        assert _float("1.0d+02") == 100.0
+        assert _float("1.0E+02") == 100.0
+        assert _float(3) == 3.0
+
+
+class TestFormat(unittest.TestCase):
+    """Unit test of formatting helpers."""
+
+    def test_number_to_str(self):
+        assert number_to_str(12) == "12"
+        assert number_to_str(12, int_format="5d") == "   12"
+        assert number_to_str(1.5) == "  1.50000000e+00"
+        assert number_to_str(-0.0) == "  0.00000000e+00"
+        assert number_to_str(1.5, float_format="16.8E") == "  1.50000000E+00"
+        with pytest.raises(TypeError):
+            number_to_str("1.5")  # type: ignore
+
+    def test_format_comment(self):
+        assert format_comment("  abc ") == "# abc"
+        assert format_comment("  abc ", strip=False) == "#   abc"
+        assert format_comment("# abc") == "# abc"
+        assert format_comment("") == "#"
+        assert format_comment("abc", add_sharp=False) == "abc"
+        assert format_comment(["a", "# b", " "]) == ["# a", "# b", "#"]
+
+    def test_float_lower(self):
+        opt = LineOutputOption()
+        line = OneIndexLine(1, 1.5)
+        assert line.to_slha(opt) == ["     1     1.50000000E+00   #"]
+        opt.float_lower = True
+        assert opt.float_lower
+        assert line.to_slha(opt) == ["     1     1.50000000e+00   #"]
+
+    def test_float_lower_dumper(self):
+        block = Block("MASS")
+        block[25] = 125.0
+        assert "1.25000000E+02" in SLHADumper().dump_block(block)[1]
+        line = SLHADumper(float_lower=True).dump_block(block)[1]
+        assert "1.25000000e+02" in line
+        dumper = SLHADumper()
+        dumper.set_config("float_lower", True)
+        assert "1.25000000e+02" in dumper.dump_block(block)[1]
@@ -0,0 +1,65 @@
+"""Unit test of `slha` module."""
+
+import logging
+import unittest
+
+import pytest
+
+from yaslha.block import Block, Decay
+from yaslha.slha import BlocksDict, DecaysDict
+
+logger = logging.getLogger("test_info")
+
+
+class TestBlocksDict(unittest.TestCase):
+    """Unit test of `BlocksDict`."""
+
+    def setUp(self):
+        self.d = BlocksDict()
+        self.d["mass"] = Block("MASS")
+
+    def test_consistency(self):
+        self.d |= {"nmix": Block("NMIX")}
+        assert list(self.d.keys()) == ["MASS", "NMIX"]
+        assert self.d.setdefault("umix", Block("UMIX")).name == "UMIX"
+        for method in [
+            lambda: self.d.__setitem__("vmix", Block("UMIX")),
+            lambda: self.d.update({"vmix": Block("UMIX")}),
+            lambda: self.d.setdefault("vmix", Block("UMIX")),
+            lambda: self.d.__ior__({"vmix": Block("UMIX")}),
+        ]:
+            with pytest.raises(SystemExit):
+                method()
+        assert "vmix" not in self.d
+
+
+class TestDecaysDict(unittest.TestCase):
+    """Unit test of `DecaysDict`."""
+
+    def setUp(self):
+        self.d = DecaysDict()
+        self.d[6] = Decay(6)
+
+    def test_consistency(self):
+        self.d |= {25: Decay(25)}
+        assert list(self.d.keys()) == [6, 25]
+        assert self.d.setdefault(6, Decay(6)) is self.d[6]
+        assert self.d.setdefault(24, Decay(24)).pid == 24
+        for method in [
+            lambda: self.d.__setitem__(7, Decay(6)),
+            lambda: self.d.update({7: Decay(6)}),
+            lambda: self.d.setdefault(7, Decay(6)),
+            lambda: self.d.__ior__({7: Decay(6)}),
+            lambda: self.d | {7: Decay(6)},
+            lambda: {7: Decay(6)} | self.d,
+        ]:
+            with pytest.raises(SystemExit):
+                method()
+        assert 7 not in self.d
+
+    def test_copy(self):
+        d = self.d.copy()
+        assert isinstance(d, DecaysDict)
+        assert list(d.items()) == list(self.d.items())
+        assert isinstance(self.d | {25: Decay(25)}, DecaysDict)
+        assert isinstance({25: Decay(25)} | self.d, DecaysDict)
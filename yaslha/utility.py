@@ -1,6 +1,6 @@
 """Utility module."""
 
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from typing import List, MutableMapping, Sequence, TypeVar, Union
 
 from yaslha._line import KeyType
@@ -61,15 +61,14 @@ BLOCKS_DEFAULT_ORDER = [
 def sort_blocks_default(block_names: Sequence[str]) -> List[str]:
     """Sort block names according to specified order."""
     result = []
-    block_names = [n.upper() for n in block_names]
-    peeked = OrderedDict([(k, False) for k in block_names])
+    rest = dict.fromkeys(n.upper() for n in block_names)  # as an ordered set
 
     for name in [n.upper() for n in BLOCKS_DEFAULT_ORDER]:
-        if name in block_names:
+        if name in rest:
             result.append(name)
-            peeked[name] = True
+            del rest[name]
 
-    return result + [k for k, v in peeked.items() if not v]
+    return result + list(rest)
 
 
 def sort_pids_default(pids: Sequence[T]) -> List[Union[T, int]]: